@@ -294,13 +294,17 @@ class NaverMedicalScraperV6:
         print(f"{'='*60}")
         
         self.driver.get(URL)
-        time.sleep(2)
+        # Poll for the results iframe instead of a fixed 2s sleep; the list
+        # inside it is then covered by the implicit wait
+        WebDriverWait(self.driver, 15).until(
+            EC.presence_of_element_located((By.ID, 'searchIframe'))
+        )
         
         # Switch to left frame (search results)
         print("\n📍 Switching to searchIframe...")
         switch_left(self.driver)
         
-        all_collected_names = []
+        all_collected_names = set()  # O(1) duplicate check per facility
         all_facility_data = []
         page_num = 0
         
@@ -327,6 +331,7 @@ class NaverMedicalScraperV6:
                 break
             
             print(f"    🖱️  Processing {len(li_elements)} facilities...")
+            names_before_page = len(all_collected_names)
             
             # Process each li element
             for idx, li in enumerate(li_elements, 1):
@@ -339,7 +344,7 @@ class NaverMedicalScraperV6:
                         print(f"\n    [{idx}/{len(li_elements)}] ⏭️  Skipping (duplicate): {facility_name}")
                         continue
                     
-                    all_collected_names.append(facility_name)
+                    all_collected_names.add(facility_name)
                     
                     print(f"\n    [{idx}/{len(li_elements)}] 🖱️  Clicking: {facility_name}")
                     
@@ -388,7 +393,7 @@ class NaverMedicalScraperV6:
                         pass
                     continue
             
-            print(f"\n✅ Page {page_num} complete: {len(all_collected_names) - len([n for n in all_collected_names[:len(all_collected_names)-len(li_elements)]])} new facilities")
+            print(f"\n✅ Page {page_num} complete: {len(all_collected_names) - names_before_page} new facilities")
             
             # Try to go to next page
             try:
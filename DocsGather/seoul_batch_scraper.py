@@ -8,13 +8,17 @@ Features:
 Structure: district/dong/keyword.json
 """
 
-import json
+import orjson
+import os
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Tuple
-import pandas as pd
+from typing import List, Dict, Optional, Set, Tuple
+from collections import Counter, deque
+from itertools import islice
 from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 import traceback
 import filelock
 import csv
@@ -157,15 +161,15 @@ seoul_administrative_dongs = {
 }
 
 
-def count_csv_rows(csv_path: Path) -> int:
-    """Count rows in CSV file (excluding header)"""
+def count_csv_rows(csv_path: Path, limit: Optional[int] = None) -> int:
+    """Count rows in CSV file (excluding header), stopping after limit rows"""
     try:
         if not csv_path.exists():
             return 0
         with open(csv_path, 'r', encoding='utf-8-sig') as f:
             reader = csv.reader(f)
             next(reader, None)  # Skip header
-            return sum(1 for row in reader)
+            return sum(1 for row in islice(reader, limit))
     except:
         return 0
 
@@ -185,7 +189,8 @@ def is_dong_complete(output_dir: Path, gu: str, dong: str, first_keyword: str =
         True if CSV exists with >= min_entries rows
     """
     csv_path = output_dir / gu / dong / f"{first_keyword}.csv"
-    row_count = count_csv_rows(csv_path)
+    # Only need to know whether min_entries is reached, not the full count
+    row_count = count_csv_rows(csv_path, limit=min_entries)
     return row_count >= min_entries
 
 
@@ -253,9 +258,9 @@ def scrape_single_dong(task: Dict, output_dir: str, headless: bool, max_pages: i
                 csv_path = dong_dir / f"{keyword}.csv"
                 
                 if results:
-                    # Save JSON
-                    with open(json_path, 'w', encoding='utf-8') as f:
-                        json.dump(results, f, ensure_ascii=False, indent=2)
+                    # Save JSON (compact: only merge_results reads it back)
+                    with open(json_path, 'wb') as f:
+                        f.write(orjson.dumps(results))
                     
                     # Save CSV
                     try:
@@ -274,8 +279,7 @@ def scrape_single_dong(task: Dict, output_dir: str, headless: bool, max_pages: i
                     results_summary['total_facilities'] += len(results)
                 else:
                     # Save empty file
-                    with open(json_path, 'w', encoding='utf-8') as f:
-                        json.dump([], f)
+                    json_path.write_bytes(b'[]')
                     print(f"\n⚠️  No results for {keyword}")
                 
                 results_summary['completed_keywords'].append(keyword)
@@ -289,8 +293,7 @@ def scrape_single_dong(task: Dict, output_dir: str, headless: bool, max_pages: i
                 try:
                     dong_dir.mkdir(parents=True, exist_ok=True)
                     json_path = dong_dir / f"{keyword}.json"
-                    with open(json_path, 'w', encoding='utf-8') as f:
-                        json.dump([], f)
+                    json_path.write_bytes(b'[]')
                 except:
                     pass
         
@@ -321,11 +324,21 @@ class SeoulMedicalBatchScraperV3:
     Batch scraper with parallel processing and fresh browsers per dong
     """
     
+    # Columns of the merged dataset: the scraper's facility fields, its search
+    # context and the district/dong/keyword the file came from
+    MERGE_COLUMNS = (
+        'name', 'category', 'reviews', 'address', 'phone', 'hours_status',
+        'business_hours', 'amenities', 'website', 'url', 'place_id', 'scraped_at',
+        'error', 'search_query', 'search_location', 'page_number', 'position',
+        'preview_name', 'file_district', 'file_dong', 'file_keyword'
+    )
+    
     def __init__(self, output_dir: str = 'seoul_medical_data', min_entries: int = 40):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
         self.progress_file = self.output_dir / 'progress.json'
+        self.progress_log = self.output_dir / 'progress.ndjson'
         self.progress_lock_file = self.output_dir / 'progress.json.lock'
         
         self.keywords = ['병원', '의원', '클리닉']
@@ -346,18 +359,13 @@ class SeoulMedicalBatchScraperV3:
         print(f"{'='*60}\n")
     
     def _load_progress(self) -> Dict:
-        """Load progress with file locking"""
-        lock = filelock.FileLock(str(self.progress_lock_file))
-        
-        try:
-            with lock.acquire(timeout=10):
-                if self.progress_file.exists():
-                    with open(self.progress_file, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-        except:
-            pass
+        """
+        Load progress with file locking
         
-        return {
+        progress.json is the snapshot written by older runs; every dong since
+        is a line in the append-only progress.ndjson journal, replayed here.
+        """
+        progress_data = {
             'completed_dongs': [],
             'statistics': {
                 'total_dongs_completed': 0,
@@ -366,53 +374,78 @@ class SeoulMedicalBatchScraperV3:
             },
             'start_time': datetime.now().isoformat()
         }
+        
+        lock = filelock.FileLock(str(self.progress_lock_file))
+        
+        try:
+            with lock.acquire(timeout=10):
+                if self.progress_file.exists():
+                    progress_data = orjson.loads(self.progress_file.read_bytes())
+                
+                if self.progress_log.exists():
+                    with open(self.progress_log, 'rb') as f:
+                        for line in f:
+                            if not line.strip():
+                                continue
+                            try:
+                                self._apply_summary(progress_data, orjson.loads(line))
+                            except orjson.JSONDecodeError:
+                                # Torn last line from a crash mid-write
+                                print(f"⚠️  Skipping corrupt line in {self.progress_log.name}")
+        except:
+            pass
+        
+        return progress_data
+    
+    def _apply_summary(self, progress_data: Dict, dong_summary: Dict):
+        """Fold one dong's summary into the progress totals"""
+        dong_key = f"{dong_summary['gu']}_{dong_summary['dong']}"
+        if dong_key not in progress_data['completed_dongs']:
+            progress_data['completed_dongs'].append(dong_key)
+        
+        # Update statistics
+        progress_data['statistics']['total_dongs_completed'] = len(progress_data['completed_dongs'])
+        progress_data['statistics']['total_facilities'] = \
+            progress_data['statistics'].get('total_facilities', 0) + dong_summary['total_facilities']
+        
+        for keyword in dong_summary['completed_keywords']:
+            if keyword not in progress_data['statistics']['by_keyword']:
+                progress_data['statistics']['by_keyword'][keyword] = 0
+            progress_data['statistics']['by_keyword'][keyword] += \
+                dong_summary['total_facilities'] // max(len(dong_summary['completed_keywords']), 1)
+        
+        progress_data['last_updated'] = dong_summary.get('end_time') or datetime.now().isoformat()
+        progress_data['completion_percentage'] = \
+            (len(progress_data['completed_dongs']) / self.total_dongs * 100)
     
     def _save_progress(self, dong_summary: Dict):
-        """Save progress with file locking"""
+        """Append this dong's summary to the progress journal (no rewrite)"""
         lock = filelock.FileLock(str(self.progress_lock_file))
         
         try:
             with lock.acquire(timeout=10):
-                # Load current progress
-                progress_data = self._load_progress()
-                
-                # Add this dong
-                dong_key = f"{dong_summary['gu']}_{dong_summary['dong']}"
-                if dong_key not in progress_data['completed_dongs']:
-                    progress_data['completed_dongs'].append(dong_key)
-                
-                # Update statistics
-                progress_data['statistics']['total_dongs_completed'] = len(progress_data['completed_dongs'])
-                progress_data['statistics']['total_facilities'] = \
-                    progress_data['statistics'].get('total_facilities', 0) + dong_summary['total_facilities']
-                
-                for keyword in dong_summary['completed_keywords']:
-                    if keyword not in progress_data['statistics']['by_keyword']:
-                        progress_data['statistics']['by_keyword'][keyword] = 0
-                    progress_data['statistics']['by_keyword'][keyword] += \
-                        dong_summary['total_facilities'] // max(len(dong_summary['completed_keywords']), 1)
-                
-                progress_data['last_updated'] = datetime.now().isoformat()
-                progress_data['completion_percentage'] = \
-                    (len(progress_data['completed_dongs']) / self.total_dongs * 100)
-                
-                # Save
-                with open(self.progress_file, 'w', encoding='utf-8') as f:
-                    json.dump(progress_data, f, ensure_ascii=False, indent=2)
+                line = orjson.dumps(dong_summary) + b'\n'
+                # A crash mid-write can leave a torn last line; start on a
+                # fresh line so this summary is not glued onto it
+                if self.progress_log.exists() and self.progress_log.stat().st_size:
+                    with open(self.progress_log, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            line = b'\n' + line
+                with open(self.progress_log, 'ab') as f:
+                    f.write(line)
         
         except Exception as e:
             print(f"⚠️  Progress save error: {e}")
     
-    def _is_dong_completed(self, gu: str, dong: str) -> bool:
+    def _is_dong_completed(self, gu: str, dong: str, completed_dongs: Set[str]) -> bool:
         """
         Check if dong is completed by checking:
-        1. Progress file (tracked completion)
+        1. Progress file (tracked completion), loaded once by the caller
         2. First keyword CSV exists with >= min_entries rows
         """
         # Check progress file first
-        progress_data = self._load_progress()
-        dong_key = f"{gu}_{dong}"
-        if dong_key in progress_data.get('completed_dongs', []):
+        if f"{gu}_{dong}" in completed_dongs:
             return True
         
         # Check if CSV exists with enough entries
@@ -463,12 +496,13 @@ class SeoulMedicalBatchScraperV3:
             print(f"\n🚀 PARALLEL MODE: {workers} workers")
             print(f"   Workers will start at different points for even distribution")
         
-        # Collect pending dongs
+        # Collect pending dongs (progress file read once, not once per dong)
+        completed_dongs = set(self._load_progress().get('completed_dongs', []))
         pending_dongs = []
         
         for gu, dongs in seoul_administrative_dongs.items():
             for dong in dongs:
-                if not self._is_dong_completed(gu, dong):
+                if not self._is_dong_completed(gu, dong, completed_dongs):
                     pending_dongs.append({
                         'gu': gu,
                         'dong': dong,
@@ -547,8 +581,11 @@ class SeoulMedicalBatchScraperV3:
         """Show statistics"""
         self.show_progress()
         
-        total_json = len(list(self.output_dir.rglob('*.json'))) - 1
-        total_csv = len(list(self.output_dir.rglob('*.csv')))
+        # One walk of the output tree for both counts
+        suffixes = Counter(p.suffix for p in self.output_dir.rglob('*')
+                           if p.name != self.progress_file.name)
+        total_json = suffixes['.json']
+        total_csv = suffixes['.csv']
         
         print(f"\nFiles: {total_json} JSON, {total_csv} CSV")
         
@@ -562,50 +599,127 @@ class SeoulMedicalBatchScraperV3:
         
         print(f"  Dongs with ≥{self.min_entries} entries: {complete_count}/{self.total_dongs}")
     
-    def merge_results(self):
-        """Merge all results"""
+    def _read_keyword_file(self, json_file: Path) -> List[Dict]:
+        """Load one keyword's results, tagged with where they came from"""
+        try:
+            data = orjson.loads(json_file.read_bytes())
+        except:
+            return []
+        relative_path = json_file.relative_to(self.output_dir)
+        for item in data or []:
+            item['file_district'] = relative_path.parts[0]
+            item['file_dong'] = relative_path.parts[1]
+            item['file_keyword'] = relative_path.stem
+        return data or []
+    
+    def _iter_keyword_files(self, json_files: List[Path], window: int = 16):
+        """Read keyword files on a thread pool, at most window files ahead of the consumer"""
+        # Thousands of small independent files: overlap their reads, but
+        # never let parsed files pile up faster than they are written
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            pending = deque()
+            for json_file in json_files:
+                pending.append(pool.submit(self._read_keyword_file, json_file))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def merge_results(self, write_csv: bool = False, write_json: bool = False,
+                      row_group_rows: int = 50_000):
+        """
+        Merge all results
+        
+        Writes zstd Parquet; JSON and CSV only with write_json / write_csv,
+        since both are several times larger and slower to write and re-read.
+        Files are streamed into the writers with the fixed MERGE_COLUMNS
+        schema, so at most one row group of records is held at a time.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from pyarrow import csv as pa_csv
+        
         print(f"\n📁 Merging results...")
         
-        all_json_files = [f for f in self.output_dir.rglob('*.json') 
-                          if f.name not in ['progress.json']]
+        # district/dong/keyword.json only: skips progress.json and earlier merges
+        all_json_files = list(self.output_dir.glob('*/*/*.json'))
         
         if not all_json_files:
             print("No files to merge.")
             return
         
-        all_data = []
-        for json_file in all_json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if data:
-                        relative_path = json_file.relative_to(self.output_dir)
-                        for item in data:
-                            item['file_district'] = relative_path.parts[0]
-                            item['file_dong'] = relative_path.parts[1]
-                            item['file_keyword'] = relative_path.stem
-                        all_data.extend(data)
-            except:
-                pass
-        
-        if not all_data:
-            print("No data to merge.")
-            return
-        
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
         merged_json = self.output_dir / f'_merged_all_{timestamp}.json'
-        with open(merged_json, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, ensure_ascii=False, indent=2)
-        
+        merged_parquet = self.output_dir / f'_merged_all_{timestamp}.parquet'
         merged_csv = self.output_dir / f'_merged_all_{timestamp}.csv'
-        df = pd.DataFrame(all_data)
-        df.to_csv(merged_csv, index=False, encoding='utf-8-sig')
+        
+        # Fixed schema: per-file inference would disagree on missing columns
+        schema = pa.schema([
+            (name, pa.int64() if name in ('page_number', 'position') else pa.string())
+            for name in self.MERGE_COLUMNS
+        ])
+        
+        total_rows = 0
+        place_ids = set()
+        buffered = []
+        
+        with ExitStack() as stack:
+            json_out = stack.enter_context(open(merged_json, 'wb')) if write_json else None
+            # Dictionary encoding pays off on the repeated district/dong/keyword
+            # and category strings
+            parquet_writer = stack.enter_context(
+                pq.ParquetWriter(str(merged_parquet), schema, compression='zstd',
+                                 use_dictionary=True)
+            )
+            csv_writer = None
+            if write_csv:
+                csv_out = stack.enter_context(open(merged_csv, 'wb'))
+                csv_out.write(b'\xef\xbb\xbf')  # UTF-8 BOM so Excel reads Korean text
+                csv_writer = stack.enter_context(pa_csv.CSVWriter(csv_out, schema))
+            
+            def write_buffered():
+                table = pa.Table.from_pylist(buffered, schema=schema)
+                parquet_writer.write_table(table)
+                if csv_writer:
+                    csv_writer.write_table(table)
+                buffered.clear()
+            
+            if json_out:
+                json_out.write(b'[')
+            for data in self._iter_keyword_files(all_json_files):
+                if not data:
+                    continue
+                if json_out:
+                    if total_rows:
+                        json_out.write(b',')
+                    json_out.write(b','.join(orjson.dumps(item) for item in data))
+                total_rows += len(data)
+                place_ids.update(item.get('place_id') for item in data)
+                buffered.extend(data)
+                # Batch small files up to a full row group before writing
+                if len(buffered) >= row_group_rows:
+                    write_buffered()
+            if buffered:
+                write_buffered()
+            if json_out:
+                json_out.write(b']')
+        
+        if not total_rows:
+            merged_parquet.unlink()
+            for path, wanted in ((merged_json, write_json), (merged_csv, write_csv)):
+                if wanted:
+                    path.unlink()
+            print("No data to merge.")
+            return
         
         print(f"\n✅ Merged!")
-        print(f"   Rows: {len(all_data):,}")
-        print(f"   Unique: {df['place_id'].nunique():,}")
-
+        print(f"   Rows: {total_rows:,}")
+        print(f"   Unique: {len(place_ids - {None}):,}")
+        print(f"   Parquet: {merged_parquet}")
+        if write_json:
+            print(f"   JSON: {merged_json}")
+        if write_csv:
+            print(f"   CSV: {merged_csv}")
 
 def main():
     """Main execution"""
@@ -631,7 +745,7 @@ Examples:
   # Progress
   python seoul_batch_scraper.py --progress
   
-  # Merge
+  # Merge (Parquet; add --merge-csv / --merge-json for CSV / JSON copies)
   python seoul_batch_scraper.py --merge
         """
     )
@@ -647,6 +761,10 @@ Examples:
     parser.add_argument('--progress', action='store_true')
     parser.add_argument('--stats', action='store_true')
     parser.add_argument('--merge', action='store_true')
+    parser.add_argument('--merge-csv', action='store_true',
+                       help='Also write the merged results as CSV')
+    parser.add_argument('--merge-json', action='store_true',
+                       help='Also write the merged results as JSON')
     parser.add_argument('--test', action='store_true')
     
     args = parser.parse_args()
@@ -657,13 +775,15 @@ Examples:
     )
     
     if args.progress or args.stats:
-        scraper.show_progress()
+        # get_statistics already shows progress; don't load and print it twice
         if args.stats:
             scraper.get_statistics()
+        else:
+            scraper.show_progress()
         return
     
     if args.merge:
-        scraper.merge_results()
+        scraper.merge_results(write_csv=args.merge_csv, write_json=args.merge_json)
         return
     
     if args.test:
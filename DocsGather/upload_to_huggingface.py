@@ -101,11 +101,8 @@ def load_all_data(data_dir: str = "seoul_medical_data") -> pd.DataFrame:
         duplicates = len(df) - df['place_id'].nunique()
         
         # For duplicates, keep the record with most non-null values
-        def count_non_null(row):
-            return row.notna().sum()
-        
-        # Add helper column
-        df['_completeness'] = df.apply(count_non_null, axis=1)
+        # (one vectorized count, not a Series boxed per row)
+        df['_completeness'] = df.notna().sum(axis=1)
         
         # Sort by completeness (descending) then drop duplicates
         df = df.sort_values('_completeness', ascending=False)
@@ -1,11 +1,26 @@
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 
-def switch_left(driver):
+# Iframe elements per (session, id); reused until the page replaces them
+_frames = {}
+
+def _switch(driver, frame_id):
     driver.switch_to.parent_frame()
-    left_iframe = driver.find_element(By.XPATH,'//*[@id="searchIframe"]')
-    driver.switch_to.frame(left_iframe)
+    key = (driver.session_id, frame_id)
+    frame = _frames.get(key)
+    if frame is not None:
+        try:
+            driver.switch_to.frame(frame)
+            return
+        except WebDriverException:
+            # Stale after a navigation or from another tab: look it up again
+            pass
+    frame = driver.find_element(By.ID, frame_id)
+    _frames[key] = frame
+    driver.switch_to.frame(frame)
+
+def switch_left(driver):
+    _switch(driver, 'searchIframe')
     
 def switch_right(driver):
-    driver.switch_to.parent_frame()
-    right_iframe = driver.find_element(By.XPATH,'//*[@id="entryIframe"]')
-    driver.switch_to.frame(right_iframe)
\ No newline at end of file
+    _switch(driver, 'entryIframe')
@@ -15,22 +15,35 @@ PARTITIONING LOGIC:
 """
 
 import pandas as pd
+import asyncio
 import time
-import json
+import orjson
 import os
 import re
+import hashlib
+import random
+import threading
+import sqlite3
+from collections import Counter
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 from urllib.parse import quote
-from bs4 import BeautifulSoup
+from lxml import etree
 import numpy as np
+import httpx
+import zstandard as zstd
+from tqdm import tqdm
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException, InvalidSessionIdException
 from selenium.webdriver.chrome.options import Options
 
 # Import frame switching utilities
@@ -38,6 +51,13 @@ import sys
 sys.path.insert(0, os.path.dirname(__file__))
 from utils.frame_switch import switch_left, switch_right
 
+# Pre-bound locators, shared by every navigation instead of rebuilt per call
+SEL_ENTRY_IFRAME = (By.ID, "entryIframe")
+SEL_SEARCH_IFRAME = (By.ID, "searchIframe")
+SEL_PLACE_SECTION = (By.CSS_SELECTOR, 'div.place_section')
+PLACE_SECTION_PRESENT = EC.presence_of_element_located(SEL_PLACE_SECTION)
+JS_HAS_ENTRY_IFRAME = "return !!document.getElementById('entryIframe');"
+
 
 # ============================================================================
 # UTILITY FUNCTIONS
@@ -72,23 +92,86 @@ def safe_str(value, default='N/A', max_length=None):
 # HTML PARSER - LOGIC BASED (NO LLM!)
 # ============================================================================
 
+def _has_class(name: str) -> str:
+    """XPath predicate matching one class in a space-separated class attribute"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _text(elem) -> str:
+    """Element text with every text node stripped and joined (like get_text(strip=True))"""
+    return ''.join(t.strip() for t in elem.itertext())
+
+
 class MedicalInfoHTMLParser:
     """Parse medical information HTML using logic-based approach"""
     
+    # XPath queries compiled once at import, not per facility
+    XP_SECTIONS = etree.XPath(f".//div[{_has_class('DAQTB')}]")
+    XP_HEADER = etree.XPath(f".//h3[{_has_class('fr6Pj')}]")
+    XP_TABLE = etree.XPath(".//table")
+    XP_TBODY = etree.XPath(".//tbody")
+    XP_ROWS = etree.XPath(".//tr")
+    XP_CELLS = etree.XPath(".//*[self::th or self::td]")
+    XP_LIST = etree.XPath(".//ul")
+    XP_DEPT_LIST = etree.XPath(f".//ul[{_has_class('xrrcZ')}]")
+    XP_LIST_ITEMS = etree.XPath(f".//li[{_has_class('zxtJF')}]")
+    XP_COPYRIGHT = etree.XPath(f".//div[{_has_class('w8afO')}]")
+    XP_MORE_INFO = etree.XPath(f".//div[{_has_class('x4zu8')}]")
+    XP_BLUELINK = etree.XPath(f".//a[{_has_class('place_bluelink')}]")
+    
+    # Table sections: header label -> (result field, key column, value column).
+    # Checked in order, so 진료과목별 wins over the plain 진료과목 list section
+    TABLE_SECTIONS = (
+        ('진료과목별 전문의 정보', ('specialist_by_department', 'department', 'specialist_count')),
+        ('특수진료장비', ('special_equipment', 'equipment_name', 'count')),
+        ('우수기관 평가정보', ('excellent_institution_evaluation', 'evaluation_item', 'evaluation_info')),
+        ('의료인 수', ('medical_staff_count', 'staff_type', 'count')),
+    )
+    
+    # lxml parsers must not be shared between threads
+    _local = threading.local()
+    
+    @classmethod
+    def _html_parser(cls) -> etree.HTMLParser:
+        parser = getattr(cls._local, 'parser', None)
+        if parser is None:
+            parser = etree.HTMLParser(collect_ids=False, remove_comments=True)
+            cls._local.parser = parser
+        return parser
+    
+    @classmethod
+    def to_tree(cls, html_content: str):
+        """Parse an HTML fragment into an lxml tree (None if empty)"""
+        if not html_content:
+            return None
+        return etree.fromstring(html_content, cls._html_parser())
+    
+    @classmethod
+    def _table_section(cls, header_text: str) -> Optional[Tuple[str, str, str]]:
+        for label, field in cls.TABLE_SECTIONS:
+            if label in header_text:
+                return field
+        return None
+    
+    @staticmethod
+    def _first(xpath, elem):
+        found = xpath(elem)
+        return found[0] if found else None
+    
     @staticmethod
     def parse_table(table_elem) -> List[Dict]:
         """Parse HTML table into list of dicts"""
         rows = []
         try:
-            tbody = table_elem.find('tbody')
-            if not tbody:
+            tbody = MedicalInfoHTMLParser._first(MedicalInfoHTMLParser.XP_TBODY, table_elem)
+            if tbody is None:
                 return rows
             
-            for tr in tbody.find_all('tr'):
-                cells = tr.find_all(['th', 'td'])
+            for tr in MedicalInfoHTMLParser.XP_ROWS(tbody):
+                cells = MedicalInfoHTMLParser.XP_CELLS(tr)
                 if len(cells) >= 2:
-                    key = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
+                    key = _text(cells[0])
+                    value = _text(cells[1])
                     rows.append({'key': key, 'value': value})
         except Exception as e:
             print(f"          ⚠ Error parsing table: {e}")
@@ -100,8 +183,8 @@ class MedicalInfoHTMLParser:
         """Parse HTML list into list of strings"""
         items = []
         try:
-            for li in ul_elem.find_all('li', class_='zxtJF'):
-                text = li.get_text(strip=True)
+            for li in MedicalInfoHTMLParser.XP_LIST_ITEMS(ul_elem):
+                text = _text(li)
                 if text:
                     items.append(text)
         except Exception as e:
@@ -110,102 +193,82 @@ class MedicalInfoHTMLParser:
         return items
     
     @staticmethod
-    def parse_medical_info(html_content: str) -> Dict:
-        """Parse medical info HTML into structured data"""
+    def parse_medical_info(html_content) -> Dict:
+        """
+        Parse medical info HTML into structured data
+        
+        Args:
+            html_content: HTML string, or a tree already parsed with to_tree()
+        """
         result = {}
+        first = MedicalInfoHTMLParser._first
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            sections = soup.find_all('div', class_='DAQTB')
+            if isinstance(html_content, str):
+                root = MedicalInfoHTMLParser.to_tree(html_content)
+            else:
+                root = html_content
+            if root is None:
+                return result
             
-            for section in sections:
-                h3 = section.find('h3', class_='fr6Pj')
-                if not h3:
+            for section in MedicalInfoHTMLParser.XP_SECTIONS(root):
+                h3 = first(MedicalInfoHTMLParser.XP_HEADER, section)
+                if h3 is None:
                     continue
                 
-                header_text = h3.get_text(strip=True)
+                header_text = _text(h3)
                 
-                # Section 1: 진료과목별 전문의 정보
-                if '진료과목별 전문의 정보' in header_text:
-                    table = section.find('table')
-                    if table:
+                # Sections 1,3,4,5: two-column tables, renamed per section
+                field = MedicalInfoHTMLParser._table_section(header_text)
+                if field is not None:
+                    name, key_col, value_col = field
+                    table = first(MedicalInfoHTMLParser.XP_TABLE, section)
+                    if table is not None:
                         table_data = MedicalInfoHTMLParser.parse_table(table)
                         if table_data:
-                            result['specialist_by_department'] = [
-                                {'department': row['key'], 'specialist_count': row['value']}
+                            result[name] = [
+                                {key_col: row['key'], value_col: row['value']}
                                 for row in table_data
                             ]
                 
                 # Section 2: 진료과목
                 elif '진료과목' in header_text and '진료과목별' not in header_text:
-                    ul = section.find('ul', class_='xrrcZ')
-                    if ul:
+                    ul = first(MedicalInfoHTMLParser.XP_DEPT_LIST, section)
+                    if ul is not None:
                         departments = MedicalInfoHTMLParser.parse_list(ul)
                         if departments:
                             result['medical_departments'] = departments
                 
-                # Section 3: 특수진료장비
-                elif '특수진료장비' in header_text:
-                    table = section.find('table')
-                    if table:
-                        table_data = MedicalInfoHTMLParser.parse_table(table)
-                        if table_data:
-                            result['special_equipment'] = [
-                                {'equipment_name': row['key'], 'count': row['value']}
-                                for row in table_data
-                            ]
-                
-                # Section 4: 우수기관 평가정보
-                elif '우수기관 평가정보' in header_text:
-                    table = section.find('table')
-                    if table:
-                        table_data = MedicalInfoHTMLParser.parse_table(table)
-                        if table_data:
-                            result['excellent_institution_evaluation'] = [
-                                {'evaluation_item': row['key'], 'evaluation_info': row['value']}
-                                for row in table_data
-                            ]
-                
-                # Section 5: 의료인 수
-                elif '의료인 수' in header_text:
-                    table = section.find('table')
-                    if table:
-                        table_data = MedicalInfoHTMLParser.parse_table(table)
-                        if table_data:
-                            result['medical_staff_count'] = [
-                                {'staff_type': row['key'], 'count': row['value']}
-                                for row in table_data
-                            ]
-                
                 # Section 6: 주차
                 elif '주차' in header_text:
-                    ul = section.find('ul')
-                    if ul:
+                    ul = first(MedicalInfoHTMLParser.XP_LIST, section)
+                    if ul is not None:
                         parking_items = MedicalInfoHTMLParser.parse_list(ul)
                         if parking_items:
                             result['parking'] = parking_items
                     else:
-                        text = section.get_text(strip=True)
+                        text = _text(section)
                         text = text.replace(header_text, '').strip()
                         if text:
-                            result['parking'] = text
+                            # Keep parking a list so the column has one type
+                            result['parking'] = [text]
             
             # Extract copyright info
-            copyright_div = soup.find('div', class_='w8afO')
-            if copyright_div:
-                copyright_text = copyright_div.get_text(strip=True)
+            copyright_div = first(MedicalInfoHTMLParser.XP_COPYRIGHT, root)
+            if copyright_div is not None:
+                copyright_text = _text(copyright_div)
                 if copyright_text:
                     result['copyright_info'] = copyright_text
             
             # Extract more info link
-            more_info_div = soup.find('div', class_='x4zu8')
-            if more_info_div:
-                link = more_info_div.find('a', class_='place_bluelink')
-                if link:
+            more_info_div = first(MedicalInfoHTMLParser.XP_MORE_INFO, root)
+            if more_info_div is not None:
+                link = first(MedicalInfoHTMLParser.XP_BLUELINK, more_info_div)
+                if link is not None:
                     href = link.get('href')
                     if href:
                         result['more_info_link'] = href
-                    link_text = link.get_text(strip=True)
+                    link_text = _text(link)
                     if link_text:
                         result['more_info_text'] = link_text
             
@@ -229,16 +292,36 @@ class DatasetManager:
         self.cache_dir.mkdir(exist_ok=True)
         self.facilities_file = self.cache_dir / "seoul_medical_facilities.parquet"
     
+    REQUIRED_COLUMNS = ('place_id', 'name')
+    
     def check_dataset_exists(self) -> bool:
-        """Check if dataset is already downloaded"""
-        exists = self.facilities_file.exists()
-        if exists:
-            print(f"✓ Dataset found: {self.facilities_file}")
-            file_size = self.facilities_file.stat().st_size / (1024 * 1024)
-            print(f"  File size: {file_size:.2f} MB")
-        else:
+        """
+        Check the cached dataset is present and readable
+        
+        Only the parquet footer is read, so a truncated or foreign file is
+        caught (and re-downloaded) without scanning any column data.
+        """
+        if not self.facilities_file.exists():
             print(f"✗ Dataset not found: {self.facilities_file}")
-        return exists
+            return False
+        
+        import pyarrow.parquet as pq
+        
+        try:
+            meta = pq.read_metadata(self.facilities_file)
+        except Exception as e:
+            print(f"✗ Cached dataset unreadable, re-downloading: {e}")
+            return False
+        
+        missing = set(self.REQUIRED_COLUMNS) - set(meta.schema.names)
+        if meta.num_rows == 0 or missing:
+            print(f"✗ Cached dataset invalid (rows={meta.num_rows}, missing={sorted(missing)}), re-downloading")
+            return False
+        
+        print(f"✓ Dataset found: {self.facilities_file}")
+        file_size = self.facilities_file.stat().st_size / (1024 * 1024)
+        print(f"  File size: {file_size:.2f} MB, {meta.num_rows:,} rows")
+        return True
     
     def download_dataset(self) -> pd.DataFrame:
         """Download dataset from HuggingFace"""
@@ -246,10 +329,19 @@ class DatasetManager:
         try:
             from datasets import load_dataset
             
+            import pyarrow.parquet as pq
+            
             dataset = load_dataset(self.dataset_name, split='train')
-            df = dataset.to_pandas()
+            table = dataset.with_format('arrow')[:]
+            
+            # Write beside the cache and rename, so an interrupted download
+            # never leaves a truncated parquet behind
+            tmp_file = self.facilities_file.with_suffix('.parquet.tmp')
+            pq.write_table(table, tmp_file)
+            os.replace(tmp_file, self.facilities_file)
             
-            df.to_parquet(self.facilities_file, index=False)
+            # Same Arrow-backed dtypes as a cached load, not object strings
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
             print(f"✓ Downloaded and cached {len(df)} facilities")
             print(f"  Saved to: {self.facilities_file}")
             
@@ -259,18 +351,32 @@ class DatasetManager:
             print(f"✗ Error downloading dataset: {e}")
             raise
     
-    def load_dataset(self, force_download=False) -> pd.DataFrame:
-        """Load dataset, downloading if necessary"""
+    def load_dataset(self, force_download=False,
+                     columns: Optional[Tuple[str, ...]] = ('place_id', 'name')) -> pd.DataFrame:
+        """
+        Load dataset, downloading if necessary
+        
+        Args:
+            force_download: Re-download even if cached
+            columns: Columns to load (None = all). Enrichment only needs
+                place_id and name, which keeps each partition worker's RSS low
+        """
         if force_download or not self.check_dataset_exists():
             df = self.download_dataset()
+            if columns is not None:
+                df = df[list(columns)]
         else:
+            import pyarrow.parquet as pq
+            
             print(f"\nLoading cached dataset...")
-            df = pd.read_parquet(self.facilities_file)
+            table = pq.read_table(self.facilities_file,
+                                  columns=list(columns) if columns is not None else None,
+                                  memory_map=True)
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
             print(f"✓ Loaded {len(df)} facilities from cache")
         
         # Validate required columns
-        required_cols = ['place_id', 'name']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+        missing_cols = [col for col in self.REQUIRED_COLUMNS if col not in df.columns]
         if missing_cols:
             raise ValueError(f"Dataset missing required columns: {missing_cols}")
         
@@ -285,6 +391,214 @@ class DatasetManager:
         return df
 
 
+# ============================================================================
+# ADAPTIVE RATE LIMITER
+# ============================================================================
+
+class AIMDRateLimiter:
+    """
+    Pace requests to Naver by how the server is actually responding
+    
+    Every success shrinks the gap between requests by 5% (a gentle
+    multiplicative increase of the rate, not a strict additive step), down to
+    min_delay; a 429/5xx or failed navigation doubles it and honours
+    Retry-After. One instance is shared by the HTTP prefetch thread and the
+    browser loop, so the state is lock-protected.
+    """
+    
+    def __init__(self, delay: float = 0.2, min_delay: float = 0.05,
+                 max_delay: float = 5.0):
+        self.delay = delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Claim the next send slot; returns how long to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at)
+            self._next_at = start + self.delay
+            return start - now
+    
+    def pause(self):
+        """Blocking wait for the next slot (browser loop)"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def wait(self):
+        """Async wait for the next slot (HTTP fetches)"""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def success(self):
+        with self._lock:
+            self.delay = max(self.min_delay, self.delay * 0.95)
+    
+    def backoff(self, retry_after: float = 0.0):
+        with self._lock:
+            self.delay = min(self.max_delay, self.delay * 2)
+            self._next_at = max(self._next_at, time.monotonic() + retry_after)
+
+
+# ============================================================================
+# DIRECT HTTP CLIENT (NO BROWSER)
+# ============================================================================
+
+class NaverPlaceHTTPClient:
+    """
+    Fetch the 진료정보 section HTML straight from pcmap.place.naver.com
+    
+    This is the page the entryIframe loads, so when it answers 200 the
+    server-rendered HTML already contains the section and no browser is
+    needed. Anything else returns None and the caller falls back to Selenium.
+    """
+    
+    # Clinics are served under /hospital; a few facilities only exist as /place
+    PLACE_URLS = (
+        "https://pcmap.place.naver.com/hospital/{place_id}/home",
+        "https://pcmap.place.naver.com/place/{place_id}/home"
+    )
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Referer': 'https://map.naver.com/',
+        'Accept-Language': 'ko-KR,ko;q=0.9'
+    }
+    
+    XP_SECTIONS = etree.XPath(f".//div[{_has_class('place_section')}]")
+    XP_TITLE = etree.XPath(
+        f".//h2[{_has_class('place_section_header')}]//div[{_has_class('place_section_header_title')}]"
+    )
+    XP_CONTENT = etree.XPath(f".//div[{_has_class('place_section_content')}]")
+    
+    # Throttling and transient gateway errors are worth another try
+    RETRY_STATUS = (429, 502, 503, 504)
+    
+    def __init__(self, concurrency: int = 16, timeout: float = 10.0,
+                 max_retries: int = 3, backoff_max: float = 10.0,
+                 rate_limiter: Optional[AIMDRateLimiter] = None):
+        """
+        Args:
+            concurrency: Requests in flight at once
+            timeout: Per-request read timeout in seconds (connect is capped at 5s)
+            max_retries: Retries on RETRY_STATUS or network errors, with
+                exponential backoff and jitter (Retry-After wins if sent)
+            backoff_max: Upper bound on a single backoff sleep in seconds
+            rate_limiter: Shared pacing; fed every response status
+        """
+        self.concurrency = concurrency
+        self.timeout = httpx.Timeout(timeout, connect=min(timeout, 5.0))
+        self.max_retries = max_retries
+        self.backoff_max = backoff_max
+        self.rate_limiter = rate_limiter
+        # HTTP/2 needs the optional 'h2' package
+        try:
+            import h2  # noqa: F401
+            self.http2 = True
+        except ImportError:
+            self.http2 = False
+    
+    @staticmethod
+    def extract_medical_section(page_html: str) -> Optional[str]:
+        """Return the inner HTML of the 진료정보 section content, if present"""
+        root = MedicalInfoHTMLParser.to_tree(page_html)
+        if root is None:
+            return None
+        for section in NaverPlaceHTTPClient.XP_SECTIONS(root):
+            title = NaverPlaceHTTPClient.XP_TITLE(section)
+            if title and '진료정보' in ''.join(title[0].itertext()):
+                content = NaverPlaceHTTPClient.XP_CONTENT(section)
+                if content:
+                    inner = content[0].text or ''
+                    return inner + ''.join(
+                        etree.tostring(child, encoding='unicode', method='html')
+                        for child in content[0]
+                    )
+        return None
+    
+    def _retry_after(self, response: Optional[httpx.Response]) -> Optional[float]:
+        """Retry-After in seconds (capped at backoff_max), if the server sent one"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return None
+    
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        """Seconds to wait before retry number attempt+1"""
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        return min(self.backoff_max, 2 ** attempt) * random.uniform(0.5, 1.0)
+    
+    async def _get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """GET with bounded retries; raises the last error if every attempt failed"""
+        for attempt in range(self.max_retries + 1):
+            response = None
+            if self.rate_limiter:
+                await self.rate_limiter.wait()
+            try:
+                response = await client.get(url)
+                if response.status_code not in self.RETRY_STATUS:
+                    if self.rate_limiter:
+                        self.rate_limiter.success()
+                    return response
+            except httpx.TransportError:
+                if self.rate_limiter:
+                    self.rate_limiter.backoff()
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if self.rate_limiter:
+                    self.rate_limiter.backoff(self._retry_after(response) or 0.0)
+            if attempt == self.max_retries:
+                return response
+            await asyncio.sleep(self._backoff(attempt, response))
+    
+    async def _fetch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                     place_id: str) -> Optional[str]:
+        """Fetch one place page and cut out the medical section"""
+        async with semaphore:
+            for url in self.PLACE_URLS:
+                try:
+                    response = await self._get(client, url.format(place_id=place_id))
+                except httpx.HTTPError as e:
+                    tqdm.write(f"        ℹ️  HTTP fetch failed for {place_id}: {e}")
+                    return None
+                
+                if response.status_code == 404:
+                    continue
+                if response.status_code != 200:
+                    return None
+                return self.extract_medical_section(response.text)
+        
+        return None
+    
+    async def _fetch_all(self, place_ids: List[str]) -> Dict[str, Optional[str]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with httpx.AsyncClient(http2=self.http2, headers=self.HEADERS,
+                                     timeout=self.timeout,
+                                     follow_redirects=True) as client:
+            pages = await asyncio.gather(
+                *[self._fetch(client, semaphore, pid) for pid in place_ids]
+            )
+        return dict(zip(place_ids, pages))
+    
+    def fetch_medical_sections(self, place_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetch medical section HTML for many places concurrently
+        
+        Returns:
+            Dict of place_id -> section HTML (None where Selenium is needed)
+        """
+        if not place_ids:
+            return {}
+        return asyncio.run(self._fetch_all(place_ids))
+
+
 # ============================================================================
 # MEDICAL INFO ENRICHMENT SCRAPER (WITH PROVEN NAVIGATION!)
 # ============================================================================
@@ -292,10 +606,89 @@ class DatasetManager:
 class MedicalInfoEnrichmentScraper:
     """Scrape and enrich facilities using PROVEN navigation method"""
     
-    def __init__(self, headless: bool = True):
+    MAP_HOME_URL = "https://map.naver.com/"
+    
+    # Page weight that has nothing to do with the section we extract.
+    # Stylesheets stay: the expand buttons and lazy sections depend on layout.
+    BLOCKED_URLS = [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+        '*.mp4', '*.webm',
+        '*.woff', '*.woff2', '*.ttf', '*.otf',
+        '*map.pstatic.net*', '*nmap-tile*'
+    ]
+    
+    # Runs entirely in the browser (one ChromeDriver round-trip): find the
+    # 진료정보 section (scrolling up to 8 times for lazy sections), scroll it
+    # into view, click its expand buttons and return the content innerHTML
+    _MEDICAL_JS = """
+        const done = arguments[arguments.length - 1];
+        const findSection = () => {
+            for (const section of document.querySelectorAll('div.place_section')) {
+                const title = section.querySelector('h2.place_section_header div.place_section_header_title');
+                if (title && title.textContent.includes('진료정보')) return section;
+            }
+            return null;
+        };
+        let scrolls = 0;
+        const attempt = () => {
+            const section = findSection();
+            if (!section) {
+                if (scrolls++ >= 8) { done({found: false, expanded: 0, html: null}); return; }
+                window.scrollBy(0, 600);
+                setTimeout(attempt, 400);
+                return;
+            }
+            section.scrollIntoView({behavior: 'instant', block: 'center'});
+            let expanded = 0;
+            for (const button of section.querySelectorAll('a.fvwqf')) {
+                const text = button.textContent;
+                if (text.includes('펼쳐서 더보기') || (text.includes('더보기') && !text.includes('정보'))) {
+                    button.click();
+                    expanded++;
+                }
+            }
+            const finish = () => {
+                const content = section.querySelector('div.place_section_content');
+                done({found: true, expanded: expanded, html: content ? content.innerHTML : null});
+            };
+            if (!expanded) { finish(); return; }
+            // Resolve once the expanded rows stop changing (100ms quiet),
+            // capped at 1.5s, instead of a fixed settle delay
+            let quiet = null;
+            const observer = new MutationObserver(() => {
+                clearTimeout(quiet);
+                quiet = setTimeout(settle, 100);
+            });
+            const cap = setTimeout(() => settle(), 1500);
+            const settle = () => {
+                observer.disconnect();
+                clearTimeout(quiet);
+                clearTimeout(cap);
+                finish();
+            };
+            observer.observe(section, {childList: true, subtree: true, characterData: true});
+            quiet = setTimeout(settle, 100);
+        };
+        attempt();
+    """
+    
+    def __init__(self, headless: bool = True, user_data_dir: Optional[str] = None,
+                 raw_html_dir: Optional[str] = None):
+        """
+        Args:
+            headless: Run Chrome without a window
+            user_data_dir: Persistent Chrome profile directory, so disk cache,
+                DNS and connections survive between facilities (use one per
+                partition - Chrome locks the profile)
+            raw_html_dir: If set, archive each raw 진료정보 HTML here as
+                {place_id}.html.zst
+        """
         self.headless = headless
+        self.user_data_dir = user_data_dir
+        self.raw_html_dir = raw_html_dir
         self.driver = None
         self.wait = None
+        self._home_handle = None
         self.parser = MedicalInfoHTMLParser()
     
     def setup_driver(self):
@@ -304,15 +697,63 @@ class MedicalInfoEnrichmentScraper:
         
         options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
         options.add_argument('--window-size=1380,900')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disk-cache-size=536870912')
+        options.page_load_strategy = 'eager'
+        
+        if self.user_data_dir:
+            Path(self.user_data_dir).mkdir(parents=True, exist_ok=True)
+            options.add_argument(f'--user-data-dir={Path(self.user_data_dir).resolve()}')
+        
+        # Images are never needed to read the 진료정보 text
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2
+        })
         
         if self.headless:
             options.add_argument('--headless')
             options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
         
         self.driver = webdriver.Chrome(options=options)
-        self.driver.implicitly_wait(3)
+        # No implicit wait: a missed lookup would stall 3s per probe.
+        # Everything that must appear is waited on explicitly via self.wait
+        self.driver.implicitly_wait(0)
         self.wait = WebDriverWait(self.driver, 10)
+        
+        self._block_urls()
+        
+        # Keep one warm map tab; facilities open in tabs next to it
+        self.driver.get(self.MAP_HOME_URL)
+        self._home_handle = self.driver.current_window_handle
+    
+    def _block_urls(self):
+        """Block images, fonts and map tiles at the network layer of the current tab"""
+        # CDP network state is per tab, so every new tab needs this too
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URLS})
+    
+    def open_in_new_tab(self, url: str):
+        """Open url in a fresh tab (caches stay warm from the home tab) and switch to it"""
+        self.close_facility_tab()
+        self.driver.switch_to.default_content()
+        # Blank tab first, so the block is in place before the page requests anything
+        self.driver.switch_to.new_window('tab')
+        self._block_urls()
+        self.driver.get(url)
+    
+    def close_facility_tab(self):
+        """Close the current facility tab and return to the home tab"""
+        if not self.driver or self._home_handle is None:
+            return
+        try:
+            for handle in self.driver.window_handles:
+                if handle != self._home_handle:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+            self.driver.switch_to.window(self._home_handle)
+        except Exception as e:
+            tqdm.write(f"        ⚠ Error closing tab: {e}")
     
     def close_driver(self):
         """Close the driver"""
@@ -322,6 +763,31 @@ class MedicalInfoEnrichmentScraper:
                 print("✓ Browser closed")
             except Exception as e:
                 print(f"⚠ Error closing browser: {e}")
+            self.driver = None
+            self.wait = None
+            self._home_handle = None
+    
+    def ensure_driver(self):
+        """Start Chrome on first use, so runs served entirely over HTTP never launch it"""
+        if self.driver is None:
+            self.setup_driver()
+    
+    @staticmethod
+    def is_session_lost(error: Exception) -> bool:
+        """True if Chrome crashed or the session is gone, so the driver must restart"""
+        if isinstance(error, InvalidSessionIdException):
+            return True
+        message = str(error).lower()
+        return isinstance(error, WebDriverException) and (
+            'invalid session id' in message or 'disconnected' in message
+            or 'no such window' in message
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_driver()
     
     def clean_place_id(self, place_id) -> str:
         """
@@ -341,7 +807,7 @@ class MedicalInfoEnrichmentScraper:
             if match:
                 return match.group(1)
         except Exception as e:
-            print(f"        ⚠ Error extracting place_id: {e}")
+            tqdm.write(f"        ⚠ Error extracting place_id: {e}")
         return None
     
     def detect_iframe_structure(self) -> str:
@@ -352,20 +818,8 @@ class MedicalInfoEnrichmentScraper:
         try:
             self.driver.switch_to.default_content()
             
-            has_entry = False
-            has_search = False
-            
-            try:
-                self.driver.find_element(By.ID, "entryIframe")
-                has_entry = True
-            except NoSuchElementException:
-                pass
-            
-            try:
-                self.driver.find_element(By.ID, "searchIframe")
-                has_search = True
-            except NoSuchElementException:
-                pass
+            has_entry = bool(self.driver.find_elements(*SEL_ENTRY_IFRAME))
+            has_search = bool(self.driver.find_elements(*SEL_SEARCH_IFRAME))
             
             if has_entry and has_search:
                 return 'dual'
@@ -375,7 +829,7 @@ class MedicalInfoEnrichmentScraper:
                 return 'none'
                 
         except Exception as e:
-            print(f"        ⚠ Error detecting iframe structure: {e}")
+            tqdm.write(f"        ⚠ Error detecting iframe structure: {e}")
             return 'none'
     
     def switch_to_entry_iframe(self) -> bool:
@@ -389,33 +843,26 @@ class MedicalInfoEnrichmentScraper:
             # Method 1: Try using switch_right utility
             try:
                 switch_right(self.driver)
-                print(f"        ✓ Switched using switch_right()")
                 return True
-            except Exception as e1:
-                print(f"        ℹ️  switch_right failed: {e1}")
-                
+            except Exception:
                 # Method 2: Direct frame switch by ID
                 try:
                     self.driver.switch_to.default_content()
                     self.driver.switch_to.frame("entryIframe")
-                    print(f"        ✓ Switched using direct frame ID")
                     return True
-                except Exception as e2:
-                    print(f"        ℹ️  Direct switch failed: {e2}")
-                    
+                except Exception:
                     # Method 3: Find and switch to frame element
                     try:
                         self.driver.switch_to.default_content()
-                        iframe = self.driver.find_element(By.ID, "entryIframe")
+                        iframe = self.driver.find_element(*SEL_ENTRY_IFRAME)
                         self.driver.switch_to.frame(iframe)
-                        print(f"        ✓ Switched using frame element")
                         return True
                     except Exception as e3:
-                        print(f"        ✗ All switch methods failed: {e3}")
+                        tqdm.write(f"        ✗ All switch methods failed: {e3}")
                         return False
             
         except Exception as e:
-            print(f"        ✗ Error switching to entry iframe: {e}")
+            tqdm.write(f"        ✗ Error switching to entry iframe: {e}")
             return False
     
     def navigate_to_place_direct(self, facility_name: str, place_id: str) -> bool:
@@ -444,224 +891,141 @@ class MedicalInfoEnrichmentScraper:
             # Direct URL with both name and place_id
             direct_url = f"https://map.naver.com/p/search/{encoded_name}/place/{clean_id}"
             
-            print(f"        🔗 Direct URL: {direct_url}")
-            
             # Reset to default content
             try:
                 self.driver.switch_to.default_content()
             except:
                 pass
             
-            # Navigate to direct URL
-            self.driver.get(direct_url)
-            time.sleep(3)
+            # Navigate to direct URL in its own tab
+            self.open_in_new_tab(direct_url)
+            
+            # Wait for the detail iframe instead of sleeping a fixed 3s
+            try:
+                self.wait.until(lambda d: d.execute_script(JS_HAS_ENTRY_IFRAME))
+            except TimeoutException:
+                pass  # detect_iframe_structure reports 'none' below
             
             # Detect iframe structure
             iframe_structure = self.detect_iframe_structure()
-            print(f"        📊 Iframe structure: {iframe_structure}")
             
             if iframe_structure == 'none':
-                print(f"        ✗ No iframes found - place may not exist")
+                tqdm.write(f"        ✗ No iframes found - place may not exist")
                 return False
             
             # For both 'single' and 'dual', we need to switch to entryIframe
             if iframe_structure in ['single', 'dual']:
-                print(f"        🎯 Switching to detail page...")
-                
                 # Use robust switching method
                 if not self.switch_to_entry_iframe():
-                    print(f"        ✗ Could not switch to entry iframe")
+                    tqdm.write(f"        ✗ Could not switch to entry iframe")
                     return False
                 
-                time.sleep(1)
-                
                 # Verify detail page content loaded
                 try:
-                    self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div.place_section'))
-                    )
-                    print(f"        ✅ Detail page loaded successfully")
+                    self.wait.until(PLACE_SECTION_PRESENT)
                     
                     # Verify the place_id in URL matches what we expect
                     current_url = self.driver.current_url
                     if clean_id in current_url:
-                        print(f"        ✅ Confirmed place_id: {clean_id}")
                         return True
                     else:
-                        print(f"        ⚠ URL doesn't contain expected place_id")
+                        tqdm.write(f"        ⚠ URL doesn't contain expected place_id")
                         # Still return True if detail page loaded
                         return True
                         
                 except TimeoutException:
-                    print(f"        ⚠ Detail page content didn't load (timeout)")
+                    tqdm.write(f"        ⚠ Detail page content didn't load (timeout)")
                     return False
                     
             return False
                 
         except Exception as e:
-            print(f"        ✗ Navigation error: {e}")
+            tqdm.write(f"        ✗ Navigation error: {e}")
             return False
     
-    def click_expand_buttons_in_medical_section(self) -> int:
-        """Click only expand buttons within the medical info section"""
-        clicked_count = 0
-        
-        try:
-            sections = self.driver.find_elements(By.CSS_SELECTOR, "div.place_section")
-            
-            medical_section = None
-            for section in sections:
-                try:
-                    header = section.find_element(By.CSS_SELECTOR, "h2.place_section_header")
-                    title = header.find_element(By.CSS_SELECTOR, "div.place_section_header_title")
-                    
-                    if "진료정보" in title.text:
-                        medical_section = section
-                        break
-                except:
-                    continue
-            
-            if not medical_section:
-                return 0
-            
-            expand_buttons = medical_section.find_elements(By.CSS_SELECTOR, "a.fvwqf")
-            
-            for button in expand_buttons:
-                try:
-                    button_text = button.text
-                    if "펼쳐서 더보기" in button_text or ("더보기" in button_text and "정보" not in button_text):
-                        self.driver.execute_script(
-                            "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                            button
-                        )
-                        time.sleep(0.3)
-                        button.click()
-                        clicked_count += 1
-                        time.sleep(0.3)
-                except:
-                    continue
-            
-            if clicked_count > 0:
-                print(f"        ✓ Expanded {clicked_count} sections")
-            
-            return clicked_count
-            
-        except Exception as e:
-            return 0
+    def archive_raw_html(self, place_id: str, html_content: str):
+        """Write raw section HTML to raw_html_dir as zstd, outside the checkpoint"""
+        raw_dir = Path(self.raw_html_dir)
+        raw_dir.mkdir(parents=True, exist_ok=True)
+        path = raw_dir / f"{self.clean_place_id(place_id)}.html.zst"
+        path.write_bytes(zstd.ZstdCompressor(level=10).compress(html_content.encode('utf-8')))
     
-    def fast_scroll_to_medical_section(self) -> Optional[any]:
-        """Fast scroll to find 진료정보 section"""
-        try:
-            max_scrolls = 8
-            scroll_pause = 0.4
-            
-            xpath = "//h2[@class='place_section_header']//div[contains(text(), '진료정보')]"
-            
-            for i in range(max_scrolls):
-                try:
-                    header = self.driver.find_element(By.XPATH, xpath)
-                    section = header.find_element(By.XPATH, "./ancestor::div[@class='place_section']")
-                    return section
-                except NoSuchElementException:
-                    pass
-                
-                self.driver.execute_script("window.scrollBy(0, 600);")
-                time.sleep(scroll_pause)
-            
-            return None
-            
-        except Exception as e:
-            return None
+    def parse_medical_html(self, html_content: str, place_id: Optional[str] = None) -> Dict:
+        """
+        Run the logic-based parser over extracted 진료정보 HTML
+        
+        The raw HTML is not kept in the result (it dominated checkpoint size);
+        only a BLAKE2b hash for re-parse detection. With raw_html_dir set, it
+        is archived to disk separately.
+        """
+        result = {
+            'has_medical_info': True,
+            'medical_info_hash': hashlib.blake2b(html_content.encode('utf-8'),
+                                                 digest_size=16).hexdigest(),
+            'medical_info_parsed': {},
+            'parsing_success': False
+        }
+        
+        if self.raw_html_dir and place_id is not None:
+            try:
+                self.archive_raw_html(place_id, html_content)
+            except Exception as e:
+                tqdm.write(f"        ⚠ Could not archive raw HTML: {e}")
+        
+        parsed_data = self.parser.parse_medical_info(html_content)
+        
+        if parsed_data:
+            result['medical_info_parsed'] = parsed_data
+            result['parsing_success'] = True
+        else:
+            tqdm.write("        ⚠ Parsing returned empty")
+        
+        return result
     
-    def extract_medical_info_html(self) -> Optional[str]:
-        """Extract the 진료정보 section HTML"""
-        try:
-            sections = self.driver.find_elements(By.CSS_SELECTOR, "div.place_section")
-            
-            for section in sections:
-                try:
-                    header = section.find_element(By.CSS_SELECTOR, "h2.place_section_header")
-                    title = header.find_element(By.CSS_SELECTOR, "div.place_section_header_title")
-                    
-                    if "진료정보" in title.text:
-                        content = section.find_element(By.CSS_SELECTOR, "div.place_section_content")
-                        return content.get_attribute('innerHTML')
-                        
-                except NoSuchElementException:
-                    continue
-            
-            return None
-            
-        except Exception as e:
-            print(f"        ✗ Error extracting HTML: {e}")
-            return None
+    def enrich_from_html(self, place_id: str, html_content: str) -> Dict:
+        """Build an enrichment result from section HTML fetched over HTTP"""
+        result = {
+            'has_medical_info': False,
+            'medical_info_hash': None,
+            'medical_info_parsed': {},
+            'parsing_success': False,
+            'enrichment_error': None,
+            'enriched_at': datetime.now().isoformat(),
+            'verified_place_id': self.clean_place_id(place_id)
+        }
+        result.update(self.parse_medical_html(html_content, place_id))
+        return result
     
-    def extract_medical_information(self) -> Dict:
+    def extract_medical_information(self, place_id: Optional[str] = None) -> Dict:
         """Extract medical information from the detail page"""
         result = {
             'has_medical_info': False,
-            'medical_info_raw': None,
+            'medical_info_hash': None,
             'medical_info_parsed': {},
             'parsing_success': False,
             'enrichment_error': None
         }
         
         try:
-            time.sleep(1)
-            
-            print("        🔍 Looking for 진료정보 section...")
-            
-            medical_section = None
-            try:
-                xpath = "//h2[@class='place_section_header']//div[contains(text(), '진료정보')]"
-                header = self.driver.find_element(By.XPATH, xpath)
-                medical_section = header.find_element(By.XPATH, "./ancestor::div[@class='place_section']")
-                print("        ✓ Found 진료정보 section")
-            except NoSuchElementException:
-                medical_section = self.fast_scroll_to_medical_section()
-                if not medical_section:
-                    print("        ⚠ 진료정보 section not found")
-                    result['enrichment_error'] = "Medical info section not found"
-                    return result
-                print("        ✓ Found 진료정보 section (after scroll)")
+            section = self.driver.execute_async_script(self._MEDICAL_JS)
             
-            self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
-                medical_section
-            )
-            time.sleep(0.5)
-            
-            self.click_expand_buttons_in_medical_section()
-            time.sleep(0.5)
+            if not section['found']:
+                tqdm.write("        ⚠ 진료정보 section not found")
+                result['enrichment_error'] = "Medical info section not found"
+                return result
             
-            html_content = self.extract_medical_info_html()
+            html_content = section['html']
             
             if not html_content:
-                print("        ⚠ Could not extract HTML content")
+                tqdm.write("        ⚠ Could not extract HTML content")
                 result['enrichment_error'] = "Could not extract HTML"
                 return result
             
-            result['has_medical_info'] = True
-            result['medical_info_raw'] = html_content
-            
-            print("        ⚙️  Parsing with logic-based parser...")
-            
-            parsed_data = self.parser.parse_medical_info(html_content)
-            
-            if parsed_data:
-                result['medical_info_parsed'] = parsed_data
-                result['parsing_success'] = True
-                
-                fields = list(parsed_data.keys())
-                print(f"        ✓ Parsed: {len(fields)} fields")
-            else:
-                print("        ⚠ Parsing returned empty")
-                result['medical_info_parsed'] = {}
-            
+            result.update(self.parse_medical_html(html_content, place_id))
             return result
             
         except Exception as e:
-            print(f"        ✗ Error extracting medical info: {e}")
+            tqdm.write(f"        ✗ Error extracting medical info: {e}")
             result['enrichment_error'] = str(e)
             return result
     
@@ -672,7 +1036,7 @@ class MedicalInfoEnrichmentScraper:
         """
         result = {
             'has_medical_info': False,
-            'medical_info_raw': None,
+            'medical_info_hash': None,
             'medical_info_parsed': {},
             'parsing_success': False,
             'enrichment_error': None,
@@ -681,6 +1045,8 @@ class MedicalInfoEnrichmentScraper:
         }
         
         try:
+            self.ensure_driver()
+            
             # Use PROVEN direct navigation method
             if not self.navigate_to_place_direct(facility_name, place_id):
                 result['enrichment_error'] = "Could not navigate to place"
@@ -689,29 +1055,62 @@ class MedicalInfoEnrichmentScraper:
             # Store verified place_id
             result['verified_place_id'] = self.extract_place_id_from_url()
             
-            # We're already in entryIframe after navigate_to_place_direct
-            print(f"        ✓ Already in detail page iframe")
-            
-            # Wait for page to load
+            # We're already in entryIframe after navigate_to_place_direct;
+            # wait for the page to load
             try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div.place_section'))
-                )
+                self.wait.until(PLACE_SECTION_PRESENT)
             except TimeoutException:
-                print(f"        ⚠ Timeout waiting for page to load")
+                tqdm.write(f"        ⚠ Timeout waiting for page to load")
                 result['enrichment_error'] = "Page load timeout"
                 return result
             
             # Extract medical information
-            med_info = self.extract_medical_information()
+            med_info = self.extract_medical_information(place_id)
             result.update(med_info)
             
             return result
             
         except Exception as e:
-            print(f"        ✗ Error enriching facility: {e}")
+            tqdm.write(f"        ✗ Error enriching facility: {e}")
             result['enrichment_error'] = str(e)
+            if self.is_session_lost(e):
+                # Drop the dead browser; ensure_driver relaunches it next facility
+                tqdm.write(f"        ↻ Browser session lost, restarting")
+                self.close_driver()
             return result
+        
+        finally:
+            self.close_facility_tab()
+
+
+# ============================================================================
+# WORKER POOL (ONE BROWSER PER PROCESS)
+# ============================================================================
+
+# Each pool process owns exactly one scraper, created by the initializer
+_worker_scraper = None
+
+
+def _init_enrich_worker(headless: bool, cache_root: str, slots,
+                        raw_html_dir: Optional[str] = None):
+    """Pool initializer: claim a slot so each worker gets its own Chrome profile"""
+    global _worker_scraper
+    slot = slots.get()
+    _worker_scraper = MedicalInfoEnrichmentScraper(
+        headless=headless,
+        user_data_dir=str(Path(cache_root) / f"w{slot}"),
+        raw_html_dir=raw_html_dir
+    )
+
+
+def enrich_worker(facility_name: str, place_id: str) -> Dict:
+    """Enrich one facility in a pool process, starting its browser on first use"""
+    if _worker_scraper.driver is None:
+        _worker_scraper.ensure_driver()
+        # Pool processes skip atexit; Finalize runs when the worker shuts down
+        multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.close_driver,
+                                      exitpriority=10)
+    return _worker_scraper.enrich_single_facility(facility_name, place_id)
 
 
 # ============================================================================
@@ -730,6 +1129,17 @@ class PartitionedCheckpointManager:
     - Example: X=0, Y=4 → processes rows 0, 4, 8, 12, 16, ...
     - Example: X=1, Y=4 → processes rows 1, 5, 9, 13, 17, ...
     - NO OVERLAP between partitions!
+    
+    STORAGE:
+    - Every result is appended to a zstd-compressed .ndjson.zst log and
+      flushed immediately as a zstd block (one {place_id: medical_info} line
+      each); save_progress fsyncs it
+    - A log left by an earlier run is compacted before appending, so each
+      log holds a single zstd frame and a crash can only tear its tail
+    - Writes and fsyncs run in order on one background I/O thread, so the
+      scraping loop never blocks on the disk
+    - The consolidated .json is only rewritten by compact(), at shutdown
+    - Loading reads the .json and replays the log, last write wins
     """
     
     def __init__(self, partition_id: int, total_partitions: int,
@@ -740,59 +1150,217 @@ class PartitionedCheckpointManager:
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         
         self.checkpoint_file = self.checkpoint_dir / f"enrichment_progress_partition_{partition_id:03d}_of_{total_partitions:03d}.json"
+        self.log_file = self.log_path(self.checkpoint_file)
         
         self.progress_data = {}
+        self._log_fp = None
+        self._io_pool = None
+        self._reset_counters()
         
-        if self.checkpoint_file.exists():
+        if self.checkpoint_file.exists() or self.log_file.exists():
             self.load_progress()
     
+    def _reset_counters(self):
+        """Running stats, kept in step with progress_data by add_facility"""
+        self._with_info = 0
+        self._parsed = 0
+        self._verified = 0
+        self._field_counts = Counter()
+    
+    def _count(self, medical_info: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) one entry's contribution to the stats"""
+        if medical_info.get('has_medical_info'):
+            self._with_info += sign
+        if medical_info.get('parsing_success'):
+            self._parsed += sign
+        if medical_info.get('verified_place_id'):
+            self._verified += sign
+        parsed = medical_info.get('medical_info_parsed')
+        if isinstance(parsed, dict):
+            for field in parsed:
+                self._field_counts[field] += sign
+    
+    @staticmethod
+    def log_path(checkpoint_file: Path) -> Path:
+        """The compressed append-only log next to a partition's JSON"""
+        return checkpoint_file.with_suffix('.ndjson.zst')
+    
+    @staticmethod
+    def _iter_log_lines(log_file: Path):
+        """Yield raw lines from a log, plain .ndjson (older runs) or .ndjson.zst"""
+        with open(log_file, 'rb') as f:
+            if log_file.suffix != '.zst':
+                yield from f
+                return
+            reader = zstd.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+            pending = b''
+            try:
+                while True:
+                    chunk = reader.read(1 << 20)
+                    if not chunk:
+                        break
+                    *lines, pending = (pending + chunk).split(b'\n')
+                    yield from lines
+            except zstd.ZstdError:
+                # Truncated block from a crash mid-write; keep what decoded
+                print(f"⚠ Truncated zstd log {log_file.name}")
+            yield pending
+    
+    @staticmethod
+    def read_partition(checkpoint_file: Path) -> Dict:
+        """Read a partition's consolidated JSON plus its append-only logs"""
+        data = {}
+        if checkpoint_file.exists():
+            with open(checkpoint_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        
+        for log_file in (checkpoint_file.with_suffix('.ndjson'),
+                         PartitionedCheckpointManager.log_path(checkpoint_file)):
+            if not log_file.exists():
+                continue
+            for line in PartitionedCheckpointManager._iter_log_lines(log_file):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data.update(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    # Torn last line from a crash mid-write
+                    print(f"⚠ Skipping corrupt line in {log_file.name}")
+        
+        # Older checkpoints stored parking as a plain string; the Arrow schema
+        # expects list<string> and would otherwise split it into characters
+        for medical_info in data.values():
+            parsed = medical_info.get('medical_info_parsed')
+            if parsed and isinstance(parsed.get('parking'), str):
+                parsed['parking'] = [parsed['parking']]
+        return data
+    
     def load_progress(self):
-        """Load existing progress from JSON"""
+        """Load existing progress from JSON and the append-only log"""
         try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                self.progress_data = json.load(f)
+            self.progress_data = self.read_partition(self.checkpoint_file)
+            self._reset_counters()
+            for medical_info in self.progress_data.values():
+                self._count(medical_info, 1)
             print(f"✓ Loaded partition {self.partition_id}: {len(self.progress_data)} facilities")
         except Exception as e:
             print(f"⚠ Could not load progress file: {e}")
             self.progress_data = {}
+            self._reset_counters()
     
-    def save_progress(self):
-        """Save current progress to JSON"""
+    def _write_line(self, line: bytes):
+        """I/O thread: append and flush a block so a crashed process loses nothing"""
         try:
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(self.progress_data, f, ensure_ascii=False, indent=2)
+            self._log_fp.write(line)
+            self._log_fp.flush(zstd.FLUSH_BLOCK)
+        except Exception as e:
+            print(f"✗ Error writing progress log: {e}")
+    
+    def _fsync(self):
+        """I/O thread: make everything written so far durable"""
+        try:
+            os.fsync(self._log_fp.fileno())
         except Exception as e:
             print(f"✗ Error saving progress: {e}")
     
+    def _append_log(self, place_id: str, medical_info: Dict):
+        """Queue one result for the log (serialized now, written in order later)"""
+        if self._log_fp is None:
+            if self.log_file.exists() or self.checkpoint_file.with_suffix('.ndjson').exists():
+                # Fold the previous run's log in rather than appending a
+                # second frame after a possibly torn one
+                self.compact()
+            self._log_fp = zstd.ZstdCompressor(level=3).stream_writer(open(self.log_file, 'wb'))
+            self._io_pool = ThreadPoolExecutor(max_workers=1,
+                                               thread_name_prefix='checkpoint-io')
+        line = orjson.dumps({place_id: medical_info}) + b'\n'
+        self._io_pool.submit(self._write_line, line)
+    
+    def save_progress(self):
+        """Queue an fsync of the log (one per save, no rewrite)"""
+        if self._log_fp is None:
+            return
+        self._io_pool.submit(self._fsync)
+    
+    def close(self):
+        """Drain pending writes, end the zstd frame, sync and close the log file"""
+        if self._log_fp is not None:
+            self._io_pool.submit(self._log_fp.flush, zstd.FLUSH_FRAME)
+            self.save_progress()
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+            self._log_fp.close()
+            self._log_fp = None
+    
+    def compact(self):
+        """Rewrite the consolidated JSON from memory and truncate the log"""
+        self.close()
+        try:
+            tmp_file = self.checkpoint_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.progress_data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.checkpoint_file)
+            for log_file in (self.log_file, self.checkpoint_file.with_suffix('.ndjson')):
+                if log_file.exists():
+                    log_file.unlink()
+        except Exception as e:
+            print(f"✗ Error compacting progress: {e}")
+    
     def is_processed(self, place_id: str) -> bool:
         """Check if a place_id has been processed"""
         return place_id in self.progress_data
     
     def add_facility(self, place_id: str, medical_info: Dict):
         """Add facility enrichment result to progress"""
+        previous = self.progress_data.get(place_id)
+        if previous is not None:
+            self._count(previous, -1)
+        self._count(medical_info, 1)
+        
         self.progress_data[place_id] = medical_info
+        try:
+            self._append_log(place_id, medical_info)
+        except Exception as e:
+            print(f"✗ Error saving progress: {e}")
     
     def get_stats(self) -> Dict:
-        """Get statistics about current progress"""
-        total = len(self.progress_data)
-        with_info = sum(1 for v in self.progress_data.values() if v.get('has_medical_info'))
-        parsed = sum(1 for v in self.progress_data.values() if v.get('parsing_success'))
-        verified = sum(1 for v in self.progress_data.values() if v.get('verified_place_id'))
-        
+        """Get statistics about current progress (O(1), from running counters)"""
         return {
-            'total_processed': total,
-            'with_medical_info': with_info,
-            'successfully_parsed': parsed,
-            'verified_place_id': verified
+            'total_processed': len(self.progress_data),
+            'with_medical_info': self._with_info,
+            'successfully_parsed': self._parsed,
+            'verified_place_id': self._verified
         }
     
+    def get_field_counts(self) -> Counter:
+        """Number of facilities in which each parsed field was found"""
+        return +self._field_counts
+    
     @staticmethod
-    def merge_all_partitions(checkpoint_dir: str = "./data") -> Dict:
-        """Merge all partition JSON files into a single dictionary"""
+    def merge_all_partitions(checkpoint_dir: str = "./data") -> pd.DataFrame:
+        """
+        Merge all partition JSON files (and their logs) into one DataFrame
+        
+        Each partition becomes a frame and they are concatenated once, so the
+        fold happens in pandas rather than a Python dict.update loop.
+        
+        Returns:
+            DataFrame indexed by place_id (last partition wins on duplicates)
+        """
         checkpoint_path = Path(checkpoint_dir)
-        all_data = {}
+        frames = []
         
-        partition_files = sorted(checkpoint_path.glob("enrichment_progress_partition_*.json"))
+        # A partition may only have a log if it never reached compaction
+        partition_files = sorted({
+            p.with_name(p.name.split('.', 1)[0] + '.json')
+            for pattern in ("enrichment_progress_partition_*.json",
+                            "enrichment_progress_partition_*.ndjson",
+                            "enrichment_progress_partition_*.ndjson.zst")
+            for p in checkpoint_path.glob(pattern)
+        })
         
         print(f"\n{'='*70}")
         print(f"MERGING PARTITIONS")
@@ -801,25 +1369,164 @@ class PartitionedCheckpointManager:
         
         for pfile in partition_files:
             try:
-                with open(pfile, 'r', encoding='utf-8') as f:
-                    partition_data = json.load(f)
-                    all_data.update(partition_data)
-                    print(f"✓ Merged {pfile.name}: {len(partition_data)} facilities")
+                partition_data = PartitionedCheckpointManager.read_partition(pfile)
+                if partition_data:
+                    frames.append(pd.DataFrame.from_dict(partition_data, orient='index'))
+                print(f"✓ Merged {pfile.name}: {len(partition_data)} facilities")
             except Exception as e:
                 print(f"✗ Error reading {pfile.name}: {e}")
         
+        if not frames:
+            print(f"{'='*70}")
+            print(f"Total merged facilities: 0")
+            return pd.DataFrame()
+        
+        merged_df = pd.concat(frames, copy=False)
+        merged_df = merged_df[~merged_df.index.duplicated(keep='last')]
+        merged_df.index = merged_df.index.astype(str)
+        merged_df.index.name = 'place_id'
+        
         print(f"{'='*70}")
-        print(f"Total merged facilities: {len(all_data):,}")
+        print(f"Total merged facilities: {len(merged_df):,}")
         
         merged_file = checkpoint_path / "enrichment_progress_MERGED.json"
         try:
-            with open(merged_file, 'w', encoding='utf-8') as f:
-                json.dump(all_data, f, ensure_ascii=False, indent=2)
+            merged_df.to_json(merged_file, orient='index', force_ascii=False)
             print(f"✓ Saved merged file: {merged_file}")
         except Exception as e:
             print(f"✗ Error saving merged file: {e}")
         
-        return all_data
+        return merged_df
+
+
+# ============================================================================
+# SHARED TASK QUEUE (WORK STEALING)
+# ============================================================================
+
+class SQLiteTaskQueue:
+    """
+    Shared task queue so partitions can steal work from each other
+    
+    Every facility is seeded with its home partition (row_index % Y), exactly
+    like the static split. A worker claims from its own partition first; once
+    that is empty it steals from the partition with the largest unclaimed
+    backlog, so one partition with heavy pages no longer becomes the straggler.
+    Claims are made under BEGIN IMMEDIATE, so two workers never get the same
+    place_id. mark_done is buffered and written in one transaction per
+    flush() (every checkpoint save, claim and close), not one commit each.
+    """
+    
+    def __init__(self, db_file="./data/enrichment_tasks.sqlite"):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        self._pending_done = []
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only syncs at checkpoints and stays crash-safe;
+        # FULL would fsync every mark_done and claim
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS tasks (
+                place_id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                home_partition INTEGER NOT NULL,
+                owner INTEGER,
+                done INTEGER NOT NULL DEFAULT 0
+            )"""
+        )
+        # Tasks finished from a checkpoint are done but were never claimed,
+        # so pending means unclaimed *and* not done
+        self.conn.execute("DROP INDEX IF EXISTS idx_tasks_unclaimed")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_pending ON tasks (home_partition) "
+            "WHERE owner IS NULL AND done = 0"
+        )
+    
+    def _executemany(self, sql: str, rows):
+        """
+        executemany in one explicit transaction
+        
+        The connection is in autocommit mode (isolation_level=None), where
+        'with conn' opens no transaction and every row would commit on its own.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.executemany(sql, rows)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+    
+    def seed(self, tasks: List[Tuple[str, str, int]]):
+        """Insert (place_id, name, home_partition) rows, ignoring existing ones"""
+        self._executemany(
+            "INSERT OR IGNORE INTO tasks (place_id, name, home_partition) VALUES (?, ?, ?)",
+            tasks
+        )
+    
+    def mark_done(self, place_id: str):
+        """Mark a claimed task as finished (written by the next flush)"""
+        self._pending_done.append((place_id,))
+    
+    def flush(self):
+        """Write buffered mark_done calls in a single transaction"""
+        if not self._pending_done:
+            return
+        self._executemany("UPDATE tasks SET done = 1 WHERE place_id = ?", self._pending_done)
+        self._pending_done = []
+    
+    def release_stale(self, worker_id: int):
+        """Release unfinished claims left behind by a previous run of this worker"""
+        self.conn.execute(
+            "UPDATE tasks SET owner = NULL WHERE owner = ? AND done = 0", (worker_id,)
+        )
+    
+    def backlog_by_partition(self) -> Dict[int, int]:
+        """Unclaimed, unfinished task count per home partition"""
+        rows = self.conn.execute(
+            "SELECT home_partition, COUNT(*) FROM tasks WHERE owner IS NULL AND done = 0 "
+            "GROUP BY home_partition"
+        ).fetchall()
+        return dict(rows)
+    
+    def claim_batch(self, worker_id: int, batch_size: int) -> List[Tuple[str, str]]:
+        """
+        Atomically claim up to batch_size tasks for this worker
+        
+        Returns:
+            List of (place_id, name); empty when no work is left anywhere
+        """
+        self.flush()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            source = worker_id
+            backlog = self.backlog_by_partition()
+            if not backlog.get(worker_id):
+                if not backlog:
+                    self.conn.execute("COMMIT")
+                    return []
+                # Steal from the partition with the most work left
+                source = max(backlog, key=backlog.get)
+            
+            # One statement claims the batch (needs SQLite 3.35+ for RETURNING)
+            rows = self.conn.execute(
+                "UPDATE tasks SET owner = ? WHERE place_id IN ("
+                "SELECT place_id FROM tasks WHERE owner IS NULL AND done = 0 "
+                "AND home_partition = ? LIMIT ?) RETURNING place_id, name",
+                (worker_id, source, batch_size)
+            ).fetchall()
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        
+        if source != worker_id and rows:
+            print(f"  🔀 Stole {len(rows)} facilities from partition {source}")
+        return rows
+    
+    def close(self):
+        self.flush()
+        self.conn.close()
 
 
 # ============================================================================
@@ -829,6 +1536,9 @@ class PartitionedCheckpointManager:
 class EnrichmentOrchestrator:
     """Orchestrate the enrichment process with partitioning support"""
     
+    # Worker pool restarts after browser crashes before falling back to one browser
+    MAX_POOL_RESTARTS = 3
+    
     def __init__(self, partition_id: int = 0, total_partitions: int = 1,
                  output_dir="./data"):
         self.partition_id = partition_id
@@ -883,13 +1593,35 @@ class EnrichmentOrchestrator:
     def enrich_all_facilities(self,
                              facilities_df: pd.DataFrame,
                              save_freq: int = 10,
-                             headless: bool = True) -> Dict:
-        """Enrich facilities assigned to this partition"""
+                             headless: bool = True,
+                             use_http: bool = True,
+                             http_batch_size: int = 16,
+                             work_stealing: bool = False,
+                             num_workers: int = 1,
+                             keep_raw_html: bool = False) -> Dict:
+        """
+        Enrich facilities assigned to this partition
         
-        partition_df = self.filter_dataframe_by_partition(facilities_df)
+        Args:
+            facilities_df: Facilities to enrich
+            save_freq: Save checkpoint every N facilities
+            headless: Run Chrome headless (Selenium fallback)
+            use_http: Try a direct HTTP fetch first, Selenium only on failure
+            http_batch_size: Facilities fetched concurrently per HTTP batch
+            work_stealing: Claim work from a shared SQLite queue and steal
+                from other partitions once this one runs dry
+            num_workers: Browser processes for Selenium navigations. With
+                more than one, a process pool runs them concurrently while
+                this process keeps sole ownership of the checkpoint
+            keep_raw_html: Archive raw section HTML to output_dir/raw_html
+                (the checkpoint only stores its hash)
+        """
         
-        scraper = MedicalInfoEnrichmentScraper(headless=headless)
-        scraper.setup_driver()
+        if work_stealing:
+            # Every partition sees the whole dataset; the queue decides who does what
+            partition_df = facilities_df.reset_index(drop=True)
+        else:
+            partition_df = self.filter_dataframe_by_partition(facilities_df)
         
         stats = self.checkpoint_mgr.get_stats()
         total_in_partition = len(partition_df)
@@ -904,76 +1636,253 @@ class EnrichmentOrchestrator:
         print(f"Remaining: {total_in_partition - already_processed:,}")
         print(f"Save frequency: every {save_freq} facilities")
         print(f"Parser: Logic-based (NO LLM)")
+        print(f"Fetch: {'direct HTTP, Selenium fallback' if use_http else 'Selenium only'}")
+        print(f"Scheduling: {'shared queue with work stealing' if work_stealing else 'static partition'}")
+        print(f"Browser workers: {num_workers}")
         print(f"Navigation: PROVEN direct method (name+place_id URL)")
         print(f"{'='*70}\n")
         
-        processed_count = 0
+        # Collect the facilities still to do (vectorized), so HTTP fetches can be batched
+        # Only facilities whose name contains 의원 or 병원 (two plain substring
+        # searches, no regex alternation)
+        names = partition_df['name']
+        mask = ((names.str.contains('의원', regex=False, na=False)
+                 | names.str.contains('병원', regex=False, na=False))
+                & partition_df['place_id'].notna())
+        todo = partition_df.loc[mask, ['place_id', 'name']]
+        todo = todo.assign(place_id=todo['place_id'].astype(str),
+                           name=todo['name'].astype(str))
+        
+        # Skip if already processed
+        todo = todo[~todo['place_id'].isin(list(self.checkpoint_mgr.progress_data))]
+        
+        pending = [
+            (row.place_id, row.name, row.Index % self.total_partitions)
+            for row in todo.itertuples()
+        ]
+        
+        if work_stealing:
+            task_queue = SQLiteTaskQueue(self.output_dir / "enrichment_tasks.sqlite")
+            task_queue.seed(pending)
+            for place_id in self.checkpoint_mgr.progress_data:
+                task_queue.mark_done(place_id)
+            # Done flags must land before stale claims are released
+            task_queue.flush()
+            task_queue.release_stale(self.partition_id)
+            batches = iter(lambda: task_queue.claim_batch(self.partition_id, http_batch_size), [])
+        else:
+            task_queue = None
+            pending = [(pid, name) for pid, name, _ in pending]
+            batches = (pending[i:i + http_batch_size]
+                       for i in range(0, len(pending), http_batch_size))
+        
+        self._processed_count = 0
+        # Replaces the fixed 2s sleep: paced by Naver's actual responses
+        self._rate_limiter = AIMDRateLimiter()
+        http_client = NaverPlaceHTTPClient(rate_limiter=self._rate_limiter) if use_http else None
+        
+        # One browser per partition (or per pool worker), reused for every facility
+        chrome_cache_dir = self.output_dir / "chrome_cache" / f"p{self.partition_id}"
+        raw_html_dir = str(self.output_dir / "raw_html") if keep_raw_html else None
+        scraper = MedicalInfoEnrichmentScraper(headless=headless,
+                                               user_data_dir=str(chrome_cache_dir),
+                                               raw_html_dir=raw_html_dir)
+        
+        self._executor = None
+        self._pool_restarts = 0
+        if num_workers > 1:
+            self._pool_config = (num_workers, headless, str(chrome_cache_dir), raw_html_dir)
+            self._executor = self._start_pool()
+        
+        # One progress bar instead of several lines per facility; only
+        # warnings and errors are written above it
+        self._pbar = tqdm(total=total_in_partition, initial=already_processed,
+                          desc=f"Partition {self.partition_id}", unit="facility",
+                          smoothing=0.05)
         
         try:
-            for idx, row in partition_df.iterrows():
-                place_id = safe_str(row['place_id'])
-                facility_name = safe_str(row.get('name', 'Unknown'))
-                
-                # Skip if facility name does NOT contain 의원 or 병원
-                if not any(keyword in facility_name for keyword in ("의원", "병원")):
-                    continue
-                
-                # Skip if already processed
-                if self.checkpoint_mgr.is_processed(place_id):
-                    continue
-                
-                processed_count += 1
-                current_total = already_processed + processed_count
-                
-                print(f"[Partition {self.partition_id}] [{current_total}/{total_in_partition}] {facility_name}")
-                print(f"  Place ID: {place_id}")
-                
-                try:
-                    medical_info = scraper.enrich_single_facility(facility_name, place_id)
-                    
-                    self.checkpoint_mgr.add_facility(place_id, medical_info)
-                    
-                    if medical_info.get('verified_place_id'):
-                        print(f"  ✓ Verified: {medical_info['verified_place_id']}")
-                    
-                    if medical_info['has_medical_info']:
-                        if medical_info['parsing_success']:
-                            parsed = medical_info['medical_info_parsed']
-                            fields = list(parsed.keys()) if parsed else []
-                            print(f"  ✓ Extracted: {len(fields)} fields")
-                        else:
-                            print(f"  ⚠ Found medical info but parsing empty")
-                    else:
-                        if medical_info.get('enrichment_error'):
-                            print(f"  ⚠ Error: {medical_info['enrichment_error']}")
-                        else:
-                            print(f"  ⚠ No medical info section")
-                    
-                except Exception as e:
-                    print(f"  ✗ Failed: {e}")
-                    self.checkpoint_mgr.add_facility(place_id, {
-                        'has_medical_info': False,
-                        'medical_info_raw': None,
-                        'medical_info_parsed': {},
-                        'parsing_success': False,
-                        'enrichment_error': str(e),
-                        'enriched_at': datetime.now().isoformat(),
-                        'verified_place_id': None
-                    })
-                
-                if processed_count % save_freq == 0:
-                    self.checkpoint_mgr.save_progress()
-                    stats = self.checkpoint_mgr.get_stats()
-                    print(f"  💾 Progress saved: {stats['total_processed']:,} facilities")
-                
-                time.sleep(2)
+            # With a pool, the browsers live in the workers; the local one
+            # only starts if the pool had to be given up
+            for batch, prefetched in self._prefetch_batches(batches, http_client, scraper):
+                self._enrich_batch(scraper, prefetched, task_queue, batch, save_freq)
             
         finally:
+            if self._executor:
+                self._executor.shutdown()
             scraper.close_driver()
-            self.checkpoint_mgr.save_progress()
+            self._pbar.close()
+            self.checkpoint_mgr.compact()
+            if task_queue:
+                task_queue.close()
         
         return self.checkpoint_mgr.progress_data
     
+    @staticmethod
+    def _prefetch_batches(batches, http_client: Optional[NaverPlaceHTTPClient],
+                          scraper: MedicalInfoEnrichmentScraper):
+        """
+        Yield (batch, prefetched HTML) with the next batch's HTTP fetch in flight
+        
+        The fetch runs on a background thread, so the network wait for batch
+        k+1 overlaps the browser fallbacks of batch k instead of adding to it.
+        """
+        if http_client is None:
+            for batch in batches:
+                yield batch, {}
+            return
+        
+        def fetch(batch):
+            return http_client.fetch_medical_sections(
+                [scraper.clean_place_id(pid) for pid, _ in batch]
+            )
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='http-prefetch') as pool:
+            batch = next(batches, None)
+            future = pool.submit(fetch, batch) if batch else None
+            while future is not None:
+                prefetched = future.result()
+                next_batch = next(batches, None)
+                future = pool.submit(fetch, next_batch) if next_batch else None
+                yield batch, prefetched
+                batch = next_batch
+    
+    def _start_pool(self) -> ProcessPoolExecutor:
+        """Start the browser worker pool (one Chrome per process)"""
+        num_workers, headless, cache_root, raw_html_dir = self._pool_config
+        # Spawn, not fork: this process already runs checkpoint and
+        # prefetch threads, and forking a threaded process can deadlock
+        mp_context = multiprocessing.get_context('spawn')
+        slots = mp_context.Queue()
+        # After a restart, use fresh slots: Chromes orphaned by the broken
+        # pool may still hold the old profiles
+        first = self._pool_restarts * num_workers
+        for slot in range(first, first + num_workers):
+            slots.put(slot)
+        return ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=mp_context,
+            initializer=_init_enrich_worker,
+            initargs=(headless, cache_root, slots, raw_html_dir)
+        )
+    
+    def _restart_pool(self):
+        """Replace a broken pool, or drop it after MAX_POOL_RESTARTS"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pool_restarts += 1
+        if self._pool_restarts > self.MAX_POOL_RESTARTS:
+            tqdm.write(f"✗ Browser pool broke {self._pool_restarts} times; "
+                       f"continuing with a single browser")
+            self._executor = None
+        else:
+            tqdm.write(f"⚠ A browser worker died; restarting the pool "
+                       f"({self._pool_restarts}/{self.MAX_POOL_RESTARTS})")
+            self._executor = self._start_pool()
+    
+    def _enrich_in_pool(self, facilities: List[Tuple[str, str]],
+                        task_queue: Optional[SQLiteTaskQueue],
+                        save_freq: int) -> List[Tuple[str, str]]:
+        """
+        Enrich (place_id, name) pairs on the worker pool
+        
+        Returns the facilities left unrecorded because a worker died and broke
+        the pool, which has then been restarted (or dropped), so the caller
+        can re-queue them instead of checkpointing them as failed.
+        """
+        remaining = dict.fromkeys(facilities)
+        try:
+            # Workers are already paced by their own page loads, so no extra sleep
+            futures = {
+                self._executor.submit(enrich_worker, facility_name, place_id): (place_id, facility_name)
+                for place_id, facility_name in facilities
+            }
+            for future in as_completed(futures):
+                place_id, facility_name = futures[future]
+                try:
+                    medical_info = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    medical_info = self._failed_result(e)
+                self._record_result(place_id, facility_name, medical_info, task_queue, save_freq)
+                del remaining[(place_id, facility_name)]
+        except BrokenProcessPool:
+            self._restart_pool()
+            return list(remaining)
+        return []
+    
+    def _enrich_batch(self, scraper: MedicalInfoEnrichmentScraper,
+                      prefetched: Dict[str, Optional[str]],
+                      task_queue: Optional[SQLiteTaskQueue],
+                      batch: List[Tuple[str, str]],
+                      save_freq: int):
+        """Enrich one batch of (place_id, name) whose HTTP prefetch has finished"""
+        needs_browser = []
+        for place_id, facility_name in batch:
+            html_content = prefetched.get(scraper.clean_place_id(place_id))
+            if not html_content:
+                needs_browser.append((place_id, facility_name))
+                continue
+            
+            try:
+                medical_info = scraper.enrich_from_html(place_id, html_content)
+            except Exception as e:
+                medical_info = self._failed_result(e)
+            self._record_result(place_id, facility_name, medical_info, task_queue, save_freq)
+        
+        # A broken pool hands back what it had not finished; those are retried
+        # on the restarted pool, or on the local browser once it is given up
+        while needs_browser and self._executor:
+            needs_browser = self._enrich_in_pool(needs_browser, task_queue, save_freq)
+        
+        for place_id, facility_name in needs_browser:
+            try:
+                medical_info = scraper.enrich_single_facility(facility_name, place_id)
+            except Exception as e:
+                medical_info = self._failed_result(e)
+            self._record_result(place_id, facility_name, medical_info, task_queue, save_freq)
+            
+            # Failed navigations are the browser's only throttling signal
+            if medical_info.get('enrichment_error'):
+                self._rate_limiter.backoff()
+            else:
+                self._rate_limiter.success()
+            self._rate_limiter.pause()
+    
+    @staticmethod
+    def _failed_result(error: Exception) -> Dict:
+        """Checkpoint entry for a facility whose enrichment raised"""
+        tqdm.write(f"  ✗ Failed: {error}")
+        return {
+            'has_medical_info': False,
+            'medical_info_hash': None,
+            'medical_info_parsed': {},
+            'parsing_success': False,
+            'enrichment_error': str(error),
+            'enriched_at': datetime.now().isoformat(),
+            'verified_place_id': None
+        }
+    
+    def _record_result(self, place_id: str, facility_name: str, medical_info: Dict,
+                       task_queue: Optional[SQLiteTaskQueue], save_freq: int):
+        """Store one result in the checkpoint and advance the progress bar"""
+        self.checkpoint_mgr.add_facility(place_id, medical_info)
+        self._processed_count += 1
+        
+        parsed = medical_info.get('medical_info_parsed') or {}
+        self._pbar.set_postfix_str(f"{facility_name[:30]} fields={len(parsed)}", refresh=False)
+        self._pbar.update(1)
+        
+        if medical_info.get('enrichment_error'):
+            tqdm.write(f"  ⚠ {facility_name} ({place_id}): {medical_info['enrichment_error']}")
+        
+        if task_queue:
+            task_queue.mark_done(place_id)
+        
+        if self._processed_count % save_freq == 0:
+            self.checkpoint_mgr.save_progress()
+            if task_queue:
+                task_queue.flush()
+    
     def print_summary(self):
         """Print summary statistics for this partition"""
         stats = self.checkpoint_mgr.get_stats()
@@ -986,24 +1895,12 @@ class EnrichmentOrchestrator:
         print(f"Successfully parsed: {stats['successfully_parsed']:,}")
         print(f"Verified place_id: {stats['verified_place_id']:,}")
         
-        all_fields = set()
-        for med_info in self.checkpoint_mgr.progress_data.values():
-            parsed = med_info.get('medical_info_parsed')
-            if isinstance(parsed, dict):
-                all_fields.update(parsed.keys())
+        field_counts = self.checkpoint_mgr.get_field_counts()
         
-        if all_fields:
+        if field_counts:
             print(f"\nFields found:")
-            field_counts = {}
-            for field in all_fields:
-                count = sum(
-                    1 for v in self.checkpoint_mgr.progress_data.values()
-                    if isinstance(v.get('medical_info_parsed'), dict) and field in v['medical_info_parsed']
-                )
-                field_counts[field] = count
-            
-            for field in sorted(field_counts.keys(), key=lambda x: field_counts[x], reverse=True):
-                print(f"  {field}: {field_counts[field]:,} facilities")
+            for field, count in field_counts.most_common():
+                print(f"  {field}: {count:,} facilities")
         
         print(f"{'='*70}")
 
@@ -1015,35 +1912,126 @@ class EnrichmentOrchestrator:
 class DatasetMerger:
     """Merge partition results with original dataset"""
     
+    @staticmethod
+    def build_arrow_schema(enriched_df: pd.DataFrame):
+        """
+        Build an explicit Arrow schema for the enriched dataset
+        
+        medical_info_parsed becomes a real struct (lists of structs per
+        section) instead of an inferred object blob, so Parquet stores it
+        columnar and HuggingFace can convert without scanning every dict.
+        """
+        import pyarrow as pa
+        
+        def pairs(key: str, value: str):
+            return pa.list_(pa.struct([(key, pa.string()), (value, pa.string())]))
+        
+        medical_info_parsed = pa.struct([
+            ('specialist_by_department', pairs('department', 'specialist_count')),
+            ('medical_departments', pa.list_(pa.string())),
+            ('special_equipment', pairs('equipment_name', 'count')),
+            ('excellent_institution_evaluation', pairs('evaluation_item', 'evaluation_info')),
+            ('medical_staff_count', pairs('staff_type', 'count')),
+            ('parking', pa.list_(pa.string())),
+            ('copyright_info', pa.string()),
+            ('more_info_link', pa.string()),
+            ('more_info_text', pa.string())
+        ])
+        
+        enrichment_types = {
+            'place_id': pa.string(),
+            'has_medical_info': pa.bool_(),
+            'medical_info_hash': pa.string(),
+            # Only present in checkpoints written before raw HTML was dropped;
+            # blobs can exceed 2GB per column chunk, so use 64-bit offsets
+            'medical_info_raw': pa.large_string(),
+            'medical_info_parsed': medical_info_parsed,
+            'parsing_success': pa.bool_(),
+            'enrichment_error': pa.string(),
+            'enriched_at': pa.string(),
+            'verified_place_id': pa.string()
+        }
+        
+        # Original facility columns are flat, so inferring them is cheap
+        facility_cols = [c for c in enriched_df.columns if c not in enrichment_types]
+        facility_schema = pa.Schema.from_pandas(enriched_df[facility_cols], preserve_index=False)
+        
+        fields = []
+        for col in enriched_df.columns:
+            if col in enrichment_types:
+                fields.append(pa.field(col, enrichment_types[col]))
+            else:
+                fields.append(facility_schema.field(col))
+        
+        return pa.schema(fields)
+    
+    @staticmethod
+    def save_parquet(enriched_df: pd.DataFrame, output_file: Path,
+                     chunk_rows: int = 50_000):
+        """
+        Write the enriched dataset with the explicit schema and zstd compression
+        
+        Converted and written chunk_rows at a time, so only one chunk's Arrow
+        copy (with its nested medical_info_parsed structs) is ever in memory.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        schema = DatasetMerger.build_arrow_schema(enriched_df)
+        with pq.ParquetWriter(output_file, schema, compression='zstd',
+                              compression_level=7) as writer:
+            for start in range(0, len(enriched_df), chunk_rows):
+                chunk = enriched_df.iloc[start:start + chunk_rows]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema,
+                                                        preserve_index=False))
+    
     @staticmethod
     def create_enriched_dataset(facilities_df: pd.DataFrame,
                                 checkpoint_dir: str = "./data") -> pd.DataFrame:
         """Merge all partition data with original dataset"""
         
-        merged_data = PartitionedCheckpointManager.merge_all_partitions(checkpoint_dir)
+        merged_df = PartitionedCheckpointManager.merge_all_partitions(checkpoint_dir)
         
-        if not merged_data:
+        if merged_df.empty:
             print("⚠ No enrichment data to merge")
             return facilities_df
         
-        records = []
-        for place_id, med_info in merged_data.items():
-            record = {'place_id': place_id}
-            record.update(med_info)
-            records.append(record)
+        # Arrow bools carry nulls natively, so the left join and fillna below
+        # never promote the flags to Python-object columns
+        enrichment_df = merged_df.reset_index().astype({
+            'has_medical_info': 'bool[pyarrow]',
+            'parsing_success': 'bool[pyarrow]'
+        })
+        
+        # Arrow strings (pa.string, not large_string) on both sides, so the
+        # hash join runs on Arrow buffers instead of Python str objects.
+        # Rebind rather than assign into the caller's frame
+        import pyarrow as pa
+        place_id_dtype = pd.ArrowDtype(pa.string())
+        facilities_df = facilities_df.assign(place_id=facilities_df['place_id'].astype(place_id_dtype))
+        enrichment_df['place_id'] = enrichment_df['place_id'].astype(place_id_dtype)
         
-        enrichment_df = pd.DataFrame(records)
+        # Drop enrichment rows for facilities not in this dataset before joining
+        # (e.g. leftovers from experimental runs in the checkpoint dir)
+        valid_ids = pd.Index(facilities_df['place_id'].unique())
+        enrichment_df = enrichment_df.loc[enrichment_df['place_id'].isin(valid_ids)]
         
-        facilities_df['place_id'] = facilities_df['place_id'].astype(str)
-        enrichment_df['place_id'] = enrichment_df['place_id'].astype(str)
+        # One enrichment row per place_id, or the join multiplies facility rows
+        enrichment_df = enrichment_df.drop_duplicates('place_id', keep='last')
         
-        enriched_df = facilities_df.merge(enrichment_df, on='place_id', how='left')
+        try:
+            enriched_df = facilities_df.merge(enrichment_df, on='place_id', how='left',
+                                              validate='m:1')
+        except pd.errors.MergeError as e:
+            dupes = enrichment_df['place_id'][enrichment_df['place_id'].duplicated()]
+            print(f"✗ Enrichment place_id is not unique: {e}")
+            print(f"  Sample duplicates: {dupes.head(5).tolist()}")
+            raise
         
+        # medical_info_parsed stays missing for unenriched facilities; the
+        # Arrow schema stores it as a null struct, no per-row {} needed
         enriched_df['has_medical_info'] = enriched_df['has_medical_info'].fillna(False)
         enriched_df['parsing_success'] = enriched_df['parsing_success'].fillna(False)
-        enriched_df['medical_info_parsed'] = enriched_df['medical_info_parsed'].apply(
-            lambda x: x if isinstance(x, dict) else {}
-        )
         
         print(f"\n{'='*70}")
         print(f"MERGE COMPLETE")
@@ -1055,19 +2043,43 @@ class DatasetMerger:
         return enriched_df
     
     @staticmethod
-    def upload_to_huggingface(enriched_df: pd.DataFrame, dataset_name: str):
-        """Upload enriched dataset to HuggingFace"""
+    def upload_to_huggingface(parquet_file: Path, dataset_name: str):
+        """
+        Upload the enriched parquet written by save_parquet to HuggingFace
+        
+        The file already has the explicit schema and zstd compression, so it
+        is uploaded as-is instead of converting the DataFrame again.
+        """
         try:
-            from datasets import Dataset
+            from huggingface_hub import HfApi, CommitOperationAdd, CommitOperationDelete
             
             print(f"\n{'='*70}")
             print(f"UPLOADING TO HUGGINGFACE")
             print(f"{'='*70}")
             print(f"Dataset: {dataset_name}")
-            print(f"Rows: {len(enriched_df):,}")
+            print(f"File: {parquet_file} ({Path(parquet_file).stat().st_size / (1024 * 1024):.1f} MB)")
+            
+            api = HfApi()
+            api.create_repo(dataset_name, repo_type="dataset", exist_ok=True)
+            
+            # Earlier push_to_hub uploads left data/train-0000X-of-0000N.parquet
+            # shards; the default train split would load them alongside the new
+            # file, so drop them in the same commit
+            target = "data/train.parquet"
+            stale = [f for f in api.list_repo_files(dataset_name, repo_type="dataset")
+                     if f.startswith("data/train") and f != target]
+            operations = [CommitOperationDelete(path_in_repo=f) for f in stale]
+            operations.append(CommitOperationAdd(path_in_repo=target,
+                                                 path_or_fileobj=str(parquet_file)))
             
-            dataset = Dataset.from_pandas(enriched_df)
-            dataset.push_to_hub(dataset_name)
+            api.create_commit(
+                repo_id=dataset_name,
+                repo_type="dataset",
+                operations=operations,
+                commit_message="Upload enriched medical facilities"
+            )
+            if stale:
+                print(f"  Removed {len(stale)} stale train shard(s)")
             
             print(f"✓ Successfully uploaded!")
             print(f"  View at: https://huggingface.co/datasets/{dataset_name}")
@@ -1080,13 +2092,18 @@ class DatasetMerger:
 # MAIN EXECUTION
 # ============================================================================
 
-def main(partition_id: int = 0, total_partitions: int = 1):
+def main(partition_id: int = 0, total_partitions: int = 1, work_stealing: bool = False,
+         num_workers: int = 1, keep_raw_html: bool = False):
     """
     Main execution function with partitioning support
     
     Args:
         partition_id (X): Which partition to process (0-indexed, 0 to Y-1)
         total_partitions (Y): Total number of partitions
+        work_stealing: Use the shared SQLite queue; idle partitions take
+            rows from the busiest one instead of stopping early
+        num_workers: Browser processes per partition for Selenium navigations
+        keep_raw_html: Archive raw 진료정보 HTML to ./data/raw_html
     
     This partition processes rows where: (row_index % Y) == X
     
@@ -1130,7 +2147,10 @@ def main(partition_id: int = 0, total_partitions: int = 1):
     progress_data = orchestrator.enrich_all_facilities(
         facilities_df,
         save_freq=10,
-        headless=True
+        headless=True,
+        work_stealing=work_stealing,
+        num_workers=num_workers,
+        keep_raw_html=keep_raw_html
     )
     
     print("\n" + "="*70)
@@ -1161,7 +2181,8 @@ def merge_and_upload():
         cache_dir="./data"
     )
     
-    facilities_df = dataset_mgr.load_dataset(force_download=False)
+    # The merge keeps every original column
+    facilities_df = dataset_mgr.load_dataset(force_download=False, columns=None)
     
     enriched_df = DatasetMerger.create_enriched_dataset(
         facilities_df,
@@ -1169,7 +2190,7 @@ def merge_and_upload():
     )
     
     output_file = Path("./data/seoul_medical_facilities_enriched.parquet")
-    enriched_df.to_parquet(output_file, index=False)
+    DatasetMerger.save_parquet(enriched_df, output_file)
     print(f"\n✓ Saved enriched dataset: {output_file}")
     
     upload = input("\nUpload to HuggingFace? (yes/no): ").strip().lower()
@@ -1177,7 +2198,7 @@ def merge_and_upload():
     if upload == 'yes':
         dataset_name = input("Enter dataset name (e.g., username/dataset-name): ").strip()
         if dataset_name:
-            DatasetMerger.upload_to_huggingface(enriched_df, dataset_name)
+            DatasetMerger.upload_to_huggingface(output_file, dataset_name)
     
     return enriched_df
 
@@ -1199,6 +2220,9 @@ Examples:
   python script.py --partition 2 --total 4  # Processes rows 2,6,10,14,...
   python script.py --partition 3 --total 4  # Processes rows 3,7,11,15,...
   
+  # Let idle partitions steal work from busy ones:
+  python script.py --partition 0 --total 4 --work-stealing
+  
   # Merge all partitions:
   python script.py --merge
         """
@@ -1209,6 +2233,12 @@ Examples:
                        help='Total partitions Y (processes every Y-th row)')
     parser.add_argument('--merge', action='store_true',
                        help='Merge all partitions into final dataset')
+    parser.add_argument('--work-stealing', action='store_true',
+                       help='Share a SQLite task queue so idle partitions steal work')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Browser worker processes per partition (default: 1)')
+    parser.add_argument('--keep-raw-html', action='store_true',
+                       help='Archive raw medical info HTML to ./data/raw_html (zstd)')
     
     args = parser.parse_args()
     
@@ -1217,5 +2247,8 @@ Examples:
     else:
         progress_data = main(
             partition_id=args.partition,
-            total_partitions=args.total
+            total_partitions=args.total,
+            work_stealing=args.work_stealing,
+            num_workers=args.workers,
+            keep_raw_html=args.keep_raw_html
         )
\ No newline at end of file
@@ -4,13 +4,33 @@ Merge Partition Results
 Combines checkpoint files and datasets from multiple partitions
 """
 
-import pandas as pd
-import json
+import orjson
 from pathlib import Path
 from typing import List, Dict
 import argparse
 
 
+def load_checkpoint(checkpoint_file: Path) -> Dict:
+    """Load a checkpoint JSON and replay its .ndjson log, if the run never compacted"""
+    data = {}
+    if checkpoint_file.exists():
+        with open(checkpoint_file, 'rb') as f:
+            data = orjson.loads(f.read())
+    
+    log_file = checkpoint_file.with_suffix('.ndjson')
+    if log_file.exists():
+        with open(log_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    data.update(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    print(f"⚠ Skipping corrupt line in {log_file.name}")
+    return data
+
+
 def merge_checkpoint_files(data_dir: Path, total_partitions: int) -> Dict:
     """Merge JSON checkpoint files from all partitions"""
     
@@ -23,12 +43,11 @@ def merge_checkpoint_files(data_dir: Path, total_partitions: int) -> Dict:
     for partition_x in range(1, total_partitions + 1):
         checkpoint_file = data_dir / f"review_scraping_progress_p{partition_x}_of_{total_partitions}.json"
         
-        if checkpoint_file.exists():
+        if checkpoint_file.exists() or checkpoint_file.with_suffix('.ndjson').exists():
             print(f"✓ Loading partition {partition_x}/{total_partitions}...")
-            with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                partition_data = json.load(f)
-                merged_data.update(partition_data)
-                print(f"  Added {len(partition_data):,} facilities")
+            partition_data = load_checkpoint(checkpoint_file)
+            merged_data.update(partition_data)
+            print(f"  Added {len(partition_data):,} facilities")
         else:
             print(f"⚠ Partition {partition_x}/{total_partitions} not found: {checkpoint_file}")
     
@@ -36,65 +55,110 @@ def merge_checkpoint_files(data_dir: Path, total_partitions: int) -> Dict:
     
     # Save merged checkpoint
     merged_file = data_dir / "review_scraping_progress_merged.json"
-    with open(merged_file, 'w', encoding='utf-8') as f:
-        json.dump(merged_data, f, ensure_ascii=False, indent=2)
+    with open(merged_file, 'wb') as f:
+        # Compact: the merged checkpoint is machine-read, indent only adds bytes
+        f.write(orjson.dumps(merged_data))
     
     print(f"✓ Saved merged checkpoint: {merged_file}")
     
     return merged_data
 
 
-def merge_parquet_files(data_dir: Path, total_partitions: int) -> pd.DataFrame:
-    """Merge parquet review datasets from all partitions"""
+def merge_parquet_files(data_dir: Path, total_partitions: int,
+                        batch_size: int = 64_000) -> Dict:
+    """
+    Merge parquet review datasets from all partitions
+    
+    Streams record batches straight into the merged Parquet and CSV writers,
+    deduplicating on (place_id, review_index) as it goes, so peak memory is
+    one batch plus the seen-keys set rather than every partition at once.
+    Returns the dataset stats print_merge_stats needs.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
     
     print(f"\n{'='*70}")
     print("MERGING REVIEW DATASETS")
     print(f"{'='*70}")
     
-    dataframes = []
+    merged_parquet = data_dir / "seoul_medical_reviews_merged.parquet"
+    merged_csv = data_dir / "seoul_medical_reviews_merged.csv"
     
-    for partition_x in range(1, total_partitions + 1):
-        parquet_file = data_dir / f"seoul_medical_reviews_p{partition_x}_of_{total_partitions}.parquet"
-        
-        if parquet_file.exists():
+    stats = {'total_reviews': 0, 'unique_facilities': 0, 'no_review_records': 0}
+    seen_keys = set()
+    place_ids = set()
+    duplicates_removed = 0
+    schema = None
+    parquet_writer = None
+    csv_out = None
+    csv_writer = None
+    
+    try:
+        for partition_x in range(1, total_partitions + 1):
+            parquet_file = data_dir / f"seoul_medical_reviews_p{partition_x}_of_{total_partitions}.parquet"
+            
+            if not parquet_file.exists():
+                print(f"⚠ Partition {partition_x}/{total_partitions} not found: {parquet_file}")
+                continue
+            
             print(f"✓ Loading partition {partition_x}/{total_partitions}...")
-            df = pd.read_parquet(parquet_file)
-            dataframes.append(df)
-            print(f"  Rows: {len(df):,}")
-        else:
-            print(f"⚠ Partition {partition_x}/{total_partitions} not found: {parquet_file}")
-    
-    if not dataframes:
+            source = pq.ParquetFile(parquet_file)
+            print(f"  Rows: {source.metadata.num_rows:,}")
+            
+            if schema is None:
+                # First partition fixes the output schema
+                schema = source.schema_arrow
+                parquet_writer = pq.ParquetWriter(str(merged_parquet), schema, compression='zstd')
+                csv_out = open(merged_csv, 'wb')
+                csv_out.write(b'\xef\xbb\xbf')  # UTF-8 BOM so Excel reads Korean text
+                csv_writer = pa_csv.CSVWriter(csv_out, schema)
+            
+            for batch in source.iter_batches(batch_size=batch_size):
+                table = pa.Table.from_batches([batch])
+                if table.schema != schema:
+                    table = table.cast(schema)
+                
+                # Keep the first occurrence of each key (also within the batch)
+                keys = zip(table['place_id'].to_pylist(), table['review_index'].to_pylist())
+                keep = [key not in seen_keys and not seen_keys.add(key) for key in keys]
+                kept = table.filter(pa.array(keep, type=pa.bool_()))
+                duplicates_removed += table.num_rows - kept.num_rows
+                if kept.num_rows == 0:
+                    continue
+                
+                parquet_writer.write_table(kept)
+                csv_writer.write_table(kept)
+                
+                stats['total_reviews'] += kept.num_rows
+                place_ids.update(pc.unique(kept['place_id']).to_pylist())
+                stats['no_review_records'] += kept['review_text'].null_count
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+        if csv_writer is not None:
+            csv_writer.close()
+        if csv_out is not None:
+            csv_out.close()
+    
+    if schema is None:
         print("✗ No parquet files found to merge!")
-        return pd.DataFrame()
-    
-    # Merge all dataframes
-    merged_df = pd.concat(dataframes, ignore_index=True)
+        return stats
     
-    # Remove duplicates (in case of overlap)
-    initial_count = len(merged_df)
-    merged_df = merged_df.drop_duplicates(subset=['place_id', 'review_index'], keep='first')
-    duplicates_removed = initial_count - len(merged_df)
+    stats['unique_facilities'] = len(place_ids)
     
     if duplicates_removed > 0:
         print(f"\n⚠ Removed {duplicates_removed:,} duplicate reviews")
     
-    print(f"\n✓ Total merged reviews: {len(merged_df):,}")
-    
-    # Save merged dataset
-    merged_parquet = data_dir / "seoul_medical_reviews_merged.parquet"
-    merged_df.to_parquet(merged_parquet, index=False)
+    print(f"\n✓ Total merged reviews: {stats['total_reviews']:,}")
     print(f"✓ Saved merged parquet: {merged_parquet}")
-    
-    # Also save as CSV
-    merged_csv = data_dir / "seoul_medical_reviews_merged.csv"
-    merged_df.to_csv(merged_csv, index=False, encoding='utf-8-sig')
     print(f"✓ Saved merged CSV: {merged_csv}")
     
-    return merged_df
+    return stats
 
 
-def print_merge_stats(merged_checkpoint: Dict, merged_df: pd.DataFrame):
+def print_merge_stats(merged_checkpoint: Dict, dataset_stats: Dict):
     """Print statistics about merged data"""
     
     print(f"\n{'='*70}")
@@ -103,8 +167,12 @@ def print_merge_stats(merged_checkpoint: Dict, merged_df: pd.DataFrame):
     
     # Checkpoint stats
     total_facilities = len(merged_checkpoint)
-    with_reviews = sum(1 for v in merged_checkpoint.values() if v.get('has_reviews'))
-    total_review_count = sum(v.get('review_count', 0) for v in merged_checkpoint.values())
+    with_reviews = 0
+    total_review_count = 0
+    for v in merged_checkpoint.values():
+        if v.get('has_reviews'):
+            with_reviews += 1
+        total_review_count += v.get('review_count', 0)
     
     print(f"\nCheckpoint data:")
     print(f"  Total facilities processed: {total_facilities:,}")
@@ -116,18 +184,15 @@ def print_merge_stats(merged_checkpoint: Dict, merged_df: pd.DataFrame):
         print(f"  Average reviews per facility: {avg_reviews:.1f}")
     
     # Dataset stats
-    if len(merged_df) > 0:
-        unique_facilities = merged_df['place_id'].nunique()
-        total_reviews = len(merged_df)
-        
+    if dataset_stats['total_reviews'] > 0:
         print(f"\nDataset records:")
-        print(f"  Unique facilities: {unique_facilities:,}")
-        print(f"  Total review records: {total_reviews:,}")
+        print(f"  Unique facilities: {dataset_stats['unique_facilities']:,}")
+        print(f"  Total review records: {dataset_stats['total_reviews']:,}")
         
         # Check for facilities without reviews
-        no_review_records = merged_df[merged_df['review_text'].isna()]
-        if len(no_review_records) > 0:
-            print(f"  Records without reviews: {len(no_review_records):,}")
+        no_review_records = dataset_stats['no_review_records']
+        if no_review_records > 0:
+            print(f"  Records without reviews: {no_review_records:,}")
     
     print(f"{'='*70}")
 
@@ -166,11 +231,11 @@ def main():
     merged_checkpoint = merge_checkpoint_files(data_dir, args.partitions)
     
     # Merge parquet files
-    merged_df = merge_parquet_files(data_dir, args.partitions)
+    dataset_stats = merge_parquet_files(data_dir, args.partitions)
     
     # Print statistics
     if merged_checkpoint:
-        print_merge_stats(merged_checkpoint, merged_df)
+        print_merge_stats(merged_checkpoint, dataset_stats)
     
     print(f"\n{'='*70}")
     print("✅ MERGE COMPLETE")
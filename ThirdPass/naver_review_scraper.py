@@ -8,10 +8,11 @@ Searches by name and matches place_id from parquet file
 import pandas as pd
 import time
 import json
+import orjson
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from urllib.parse import quote
 from bs4 import BeautifulSoup
@@ -20,7 +21,7 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options
 
 # Import frame switching utilities (assuming you have this)
@@ -28,6 +29,16 @@ import sys
 sys.path.insert(0, os.path.dirname(__file__))
 from utils.frame_switch import switch_right
 
+# Pre-bound locators, shared by every facility instead of rebuilt per call
+SEL_ENTRY_IFRAME = (By.ID, "entryIframe")
+SEL_SEARCH_IFRAME = (By.ID, "searchIframe")
+SEL_PLACE_SECTION = (By.CSS_SELECTOR, 'div.place_section')
+SEL_REVIEW_TAB = (By.CSS_SELECTOR, 'a[data-index="1"].tpj9w._tab-menu')
+SEL_REVIEW_LIST = (By.ID, '_review_list')
+PLACE_SECTION_PRESENT = EC.presence_of_element_located(SEL_PLACE_SECTION)
+REVIEW_TAB_PRESENT = EC.presence_of_element_located(SEL_REVIEW_TAB)
+REVIEW_LIST_PRESENT = EC.presence_of_element_located(SEL_REVIEW_LIST)
+
 
 # ============================================================================
 # REVIEW HTML PARSER
@@ -245,6 +256,41 @@ class ReviewHTMLParser:
 class NaverMapsReviewScraper:
     """Scrape reviews from Naver Maps"""
     
+    # Never inspected, only downloaded. Review photos are read from the img
+    # src attribute, which is set even when the request itself is blocked
+    BLOCKED_URLS = [
+        '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+        '*.mp4', '*.webm',
+        '*.woff', '*.woff2', '*.ttf', '*.otf',
+        '*map.pstatic.net*', '*nmap-tile*'
+    ]
+    
+    # Clicks "더보기" until no more reviews arrive, entirely in the browser:
+    # after each click, poll until the review count grows (5s cap per page)
+    _EXPAND_REVIEWS_JS = """
+        const maxClicks = arguments[0];
+        const done = arguments[arguments.length - 1];
+        const count = () => document.querySelectorAll('#_review_list li.place_apply_pui').length;
+        let clicks = 0;
+        const step = () => {
+            const button = document.querySelector('a.fvwqf');
+            if (!button || !button.textContent.includes('더보기')) { done({clicks: clicks, capped: false}); return; }
+            if (clicks >= maxClicks) { done({clicks: clicks, capped: true}); return; }
+            const before = count();
+            button.scrollIntoView({behavior: 'instant', block: 'center'});
+            button.click();
+            clicks++;
+            const started = Date.now();
+            const poll = () => {
+                if (count() > before) { step(); return; }
+                if (Date.now() - started > 5000) { done({clicks: clicks, capped: false}); return; }
+                setTimeout(poll, 100);
+            };
+            poll();
+        };
+        step();
+    """
+    
     def __init__(self, headless: bool = True):
         self.headless = headless
         self.driver = None
@@ -264,8 +310,14 @@ class NaverMapsReviewScraper:
             options.add_argument('--disable-dev-shm-usage')
         
         self.driver = webdriver.Chrome(options=options)
-        self.driver.implicitly_wait(3)
+        # No implicit wait: a missed lookup would stall 3s per probe.
+        # Everything that must appear is waited on explicitly via self.wait
+        self.driver.implicitly_wait(0)
         self.wait = WebDriverWait(self.driver, 10)
+        
+        # Block images, fonts and map tiles at the network layer
+        self.driver.execute_cdp_cmd('Network.enable', {})
+        self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URLS})
     
     def close_driver(self):
         """Close the driver"""
@@ -290,20 +342,8 @@ class NaverMapsReviewScraper:
         try:
             self.driver.switch_to.default_content()
             
-            has_entry = False
-            has_search = False
-            
-            try:
-                self.driver.find_element(By.ID, "entryIframe")
-                has_entry = True
-            except NoSuchElementException:
-                pass
-            
-            try:
-                self.driver.find_element(By.ID, "searchIframe")
-                has_search = True
-            except NoSuchElementException:
-                pass
+            has_entry = bool(self.driver.find_elements(*SEL_ENTRY_IFRAME))
+            has_search = bool(self.driver.find_elements(*SEL_SEARCH_IFRAME))
             
             if has_entry and has_search:
                 return 'dual'
@@ -344,7 +384,7 @@ class NaverMapsReviewScraper:
                     # Method 3: Find and switch to frame element
                     try:
                         self.driver.switch_to.default_content()
-                        iframe = self.driver.find_element(By.ID, "entryIframe")
+                        iframe = self.driver.find_element(*SEL_ENTRY_IFRAME)
                         self.driver.switch_to.frame(iframe)
                         print(f"        ✓ Switched using frame element")
                         return True
@@ -401,9 +441,15 @@ class NaverMapsReviewScraper:
             except:
                 pass
             
-            # Navigate to direct URL
+            # Navigate to direct URL, then wait for the detail iframe
+            # instead of sleeping a fixed 3s
             self.driver.get(direct_url)
-            time.sleep(3)
+            try:
+                self.wait.until(lambda d: d.execute_script(
+                    "return !!document.getElementById('entryIframe');"
+                ))
+            except TimeoutException:
+                pass  # detect_iframe_structure reports 'none' below
             
             # Detect iframe structure
             iframe_structure = self.detect_iframe_structure()
@@ -422,13 +468,9 @@ class NaverMapsReviewScraper:
                     print(f"        ✗ Could not switch to entry iframe")
                     return False
                 
-                time.sleep(1)
-                
                 # Verify detail page content loaded
                 try:
-                    self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div.place_section'))
-                    )
+                    self.wait.until(PLACE_SECTION_PRESENT)
                     print(f"        ✅ Detail page loaded successfully")
                     
                     # Verify the place_id in URL matches what we expect
@@ -456,21 +498,13 @@ class NaverMapsReviewScraper:
         try:
             print("        🔍 Looking for review tab...")
             
-            # Wait for tab menu to be present
+            # Wait for the review tab; the wait hands back the element itself
             try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'a[data-index="1"].tpj9w._tab-menu'))
-                )
+                review_tab = self.wait.until(REVIEW_TAB_PRESENT)
             except:
                 print("        ⚠ Timeout waiting for tabs")
                 return False
             
-            # Find review tab
-            review_tab = self.driver.find_element(
-                By.CSS_SELECTOR, 
-                'a[data-index="1"].tpj9w._tab-menu'
-            )
-            
             # Verify it contains "리뷰"
             if '리뷰' not in review_tab.text:
                 print("        ⚠ Tab doesn't contain '리뷰'")
@@ -478,27 +512,23 @@ class NaverMapsReviewScraper:
             
             print("        ✓ Found review tab")
             
-            # Scroll tab into view
+            # Scroll tab into view (instant, so there is no animation to wait out)
             self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
+                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center'});",
                 review_tab
             )
-            time.sleep(0.5)
             
-            # Click with retries
+            # Click with retries; the caller waits for the review list itself
             for attempt in range(3):
                 try:
                     review_tab.click()
-                    time.sleep(2)
                     return True
                 except Exception as e:
                     if attempt < 2:
                         print(f"        ⚠ Click attempt {attempt+1} failed, retrying...")
-                        time.sleep(1)
                         # Try JavaScript click
                         try:
                             self.driver.execute_script("arguments[0].click();", review_tab)
-                            time.sleep(2)
                             return True
                         except:
                             continue
@@ -517,54 +547,24 @@ class NaverMapsReviewScraper:
     
     def click_expand_all_reviews(self) -> int:
         """Click 'expand more' button until all reviews are loaded"""
-        click_count = 0
         max_attempts = 100  # Safety limit
         
         print("        📂 Expanding all reviews...")
         
-        for attempt in range(max_attempts):
-            try:
-                # Find the "펼쳐서 더보기" button
-                expand_button = self.driver.find_element(
-                    By.CSS_SELECTOR,
-                    'a.fvwqf'
-                )
-                
-                # Verify it contains the expand text
-                if '펼쳐서 더보기' in expand_button.text or '더보기' in expand_button.text:
-                    # Scroll into view
-                    self.driver.execute_script(
-                        "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-                        expand_button
-                    )
-                    time.sleep(0.5)
-                    
-                    # Click the button
-                    try:
-                        expand_button.click()
-                    except:
-                        # Use JavaScript click if regular click fails
-                        self.driver.execute_script("arguments[0].click();", expand_button)
-                    
-                    click_count += 1
-                    time.sleep(1)  # Wait for reviews to load
-                    
-                    if click_count % 10 == 0:
-                        print(f"        ✓ Clicked expand button {click_count} times")
-                else:
-                    # Button text changed, might be at the end
-                    break
-                    
-            except (NoSuchElementException, StaleElementReferenceException):
-                # Button no longer exists - all reviews loaded
-                print(f"        ✓ All reviews expanded ({click_count} clicks)")
-                break
-            except Exception as e:
-                print(f"        ⚠ Error during expansion: {e}")
-                break
+        try:
+            # One async script for the whole loop instead of ~5 WebDriver
+            # round trips per click; allow each page its full 5s
+            self.driver.set_script_timeout(max_attempts * 5 + 10)
+            result = self.driver.execute_async_script(self._EXPAND_REVIEWS_JS, max_attempts)
+        except Exception as e:
+            print(f"        ⚠ Error during expansion: {e}")
+            return 0
         
-        if click_count >= max_attempts:
+        click_count = result['clicks']
+        if result['capped']:
             print(f"        ⚠ Reached maximum attempts ({max_attempts})")
+        else:
+            print(f"        ✓ All reviews expanded ({click_count} clicks)")
         
         return click_count
     
@@ -572,7 +572,7 @@ class NaverMapsReviewScraper:
         """Extract the review list HTML"""
         try:
             # Find the review list element
-            review_list = self.driver.find_element(By.ID, '_review_list')
+            review_list = self.driver.find_element(*SEL_REVIEW_LIST)
             
             # Get outer HTML to include the ul element itself
             html_content = review_list.get_attribute('outerHTML')
@@ -610,10 +610,7 @@ class NaverMapsReviewScraper:
             
             # Wait for page to load
             try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div.place_section'))
-                )
-                time.sleep(1)
+                self.wait.until(PLACE_SECTION_PRESENT)
             except TimeoutException:
                 print("        ⚠ Timeout waiting for page")
                 result['scrape_error'] = "Page load timeout"
@@ -625,15 +622,15 @@ class NaverMapsReviewScraper:
                 return result
             
             # Wait for reviews
-            time.sleep(2)
+            try:
+                self.wait.until(REVIEW_LIST_PRESENT)
+            except TimeoutException:
+                print("        ⚠ Timeout waiting for review list")
             
-            # Expand all reviews
+            # Expand all reviews (each click waits for its reviews to arrive)
             expand_clicks = self.click_expand_all_reviews()
             print(f"        ✓ Expanded with {expand_clicks} clicks")
             
-            # Extra wait
-            time.sleep(1)
-            
             # Extract review HTML
             review_html = self.extract_review_list_html()
             
@@ -668,31 +665,95 @@ class NaverMapsReviewScraper:
 # ============================================================================
 
 class ReviewCheckpointManager:
-    """Manage review scraping progress using JSON file"""
+    """
+    Manage review scraping progress using JSON file
+    
+    Every result is appended to a .ndjson log next to the JSON and flushed
+    immediately, so saving is O(1) per facility instead of rewriting the
+    whole file. compact() folds the log back into the JSON at shutdown.
+    """
     
     def __init__(self, checkpoint_file="./data/review_scraping_progress.json"):
         self.checkpoint_file = Path(checkpoint_file)
         self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        self.log_file = self.checkpoint_file.with_suffix('.ndjson')
         self.progress_data = {}
+        self._log_fp = None
+        self._reset_counters()
         
-        if self.checkpoint_file.exists():
+        if self.checkpoint_file.exists() or self.log_file.exists():
             self.load_progress()
     
+    def _reset_counters(self):
+        """Running stats, kept in step with progress_data by add_facility"""
+        self._with_reviews = 0
+        self._total_reviews = 0
+    
+    def _count(self, review_data: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) one entry's contribution to the stats"""
+        if review_data.get('has_reviews'):
+            self._with_reviews += sign
+        self._total_reviews += sign * review_data.get('review_count', 0)
+    
+    @staticmethod
+    def read_checkpoint(checkpoint_file: Path) -> Dict:
+        """Read a checkpoint JSON plus its append-only log (last write wins)"""
+        data = {}
+        if checkpoint_file.exists():
+            with open(checkpoint_file, 'rb') as f:
+                data = orjson.loads(f.read())
+        
+        log_file = checkpoint_file.with_suffix('.ndjson')
+        if log_file.exists():
+            with open(log_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        data.update(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        # Torn last line from a crash mid-write
+                        print(f"⚠ Skipping corrupt line in {log_file.name}")
+        return data
+    
     def load_progress(self):
-        """Load existing progress from JSON"""
+        """Load existing progress from JSON and the append-only log"""
         try:
-            with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
-                self.progress_data = json.load(f)
+            self.progress_data = self.read_checkpoint(self.checkpoint_file)
+            self._reset_counters()
+            for review_data in self.progress_data.values():
+                self._count(review_data, 1)
             print(f"✓ Loaded existing progress: {len(self.progress_data)} facilities")
         except Exception as e:
             print(f"⚠ Could not load progress file: {e}")
             self.progress_data = {}
+            self._reset_counters()
     
     def save_progress(self):
-        """Save current progress to JSON"""
+        """Make the log durable (one fsync, no rewrite)"""
+        if self._log_fp is None:
+            return
+        try:
+            os.fsync(self._log_fp.fileno())
+        except Exception as e:
+            print(f"✗ Error saving progress: {e}")
+    
+    def compact(self):
+        """Rewrite the JSON from memory and drop the log"""
+        if self._log_fp is not None:
+            self.save_progress()
+            self._log_fp.close()
+            self._log_fp = None
         try:
-            with open(self.checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(self.progress_data, f, ensure_ascii=False, indent=2)
+            tmp_file = self.checkpoint_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.progress_data, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.checkpoint_file)
+            if self.log_file.exists():
+                self.log_file.unlink()
         except Exception as e:
             print(f"✗ Error saving progress: {e}")
     
@@ -701,19 +762,28 @@ class ReviewCheckpointManager:
         return place_id in self.progress_data
     
     def add_facility(self, place_id: str, review_data: Dict):
-        """Add facility review data to progress"""
+        """Add facility review data to progress and append it to the log"""
+        previous = self.progress_data.get(place_id)
+        if previous is not None:
+            self._count(previous, -1)
+        self._count(review_data, 1)
+        
         self.progress_data[place_id] = review_data
+        if self._log_fp is None:
+            if self.log_file.exists():
+                # Fold the previous run's log in rather than appending after
+                # a possibly torn last line
+                self.compact()
+            self._log_fp = open(self.log_file, 'ab')
+        self._log_fp.write(orjson.dumps({place_id: review_data}) + b'\n')
+        self._log_fp.flush()
     
     def get_stats(self) -> Dict:
-        """Get statistics about current progress"""
-        total = len(self.progress_data)
-        with_reviews = sum(1 for v in self.progress_data.values() if v.get('has_reviews'))
-        total_reviews = sum(v.get('review_count', 0) for v in self.progress_data.values())
-        
+        """Get statistics about current progress (O(1), from running counters)"""
         return {
-            'total_processed': total,
-            'with_reviews': with_reviews,
-            'total_reviews_scraped': total_reviews
+            'total_processed': len(self.progress_data),
+            'with_reviews': self._with_reviews,
+            'total_reviews_scraped': self._total_reviews
         }
 
 
@@ -724,6 +794,14 @@ class ReviewCheckpointManager:
 class ReviewScrapingOrchestrator:
     """Orchestrate the review scraping process"""
     
+    # Columns of the flat review dataset, in order
+    REVIEW_COLUMNS = (
+        'place_id', 'facility_name', 'review_index', 'reviewer_name', 'review_text',
+        'visit_date', 'visit_count', 'verification_method', 'visit_keywords',
+        'image_urls', 'image_count', 'has_owner_response', 'owner_response_text',
+        'reaction_count', 'scraped_at'
+    )
+    
     def __init__(self, output_dir="./data", partition_x: int = 1, partition_y: int = 1):
         """
         Initialize orchestrator with optional partitioning
@@ -773,9 +851,7 @@ class ReviewScrapingOrchestrator:
         if self.partition_y > 1:
             # Get every Yth facility starting from position X-1 (0-indexed)
             # Example: partition_x=2, partition_y=5 → indices 1, 6, 11, 16, 21...
-            facilities_df = facilities_df.reset_index(drop=True)
-            partition_indices = list(range(self.partition_x - 1, len(facilities_df), self.partition_y))
-            facilities_df = facilities_df.iloc[partition_indices].copy()
+            facilities_df = facilities_df.iloc[self.partition_x - 1::self.partition_y]
             
             print(f"\n{'='*70}")
             print(f"PARTITION FILTERING")
@@ -803,17 +879,19 @@ class ReviewScrapingOrchestrator:
         print(f"Save frequency: every {save_freq} facilities")
         print(f"{'='*70}\n")
         
+        # Drop already processed facilities up front (vectorized), then walk
+        # plain tuples instead of boxing a Series per row
+        pending = pd.DataFrame({
+            'place_id': facilities_df['place_id'].astype(str),
+            'name': (facilities_df['name'].fillna('Unknown')
+                     if 'name' in facilities_df.columns else 'Unknown')
+        })
+        pending = pending[~pending['place_id'].isin(list(self.checkpoint_mgr.progress_data))]
+        
         processed_count = 0
         
         try:
-            for idx, row in facilities_df.iterrows():
-                place_id = str(row['place_id'])
-                facility_name = row.get('name', 'Unknown')
-                
-                # Skip if already processed
-                if self.checkpoint_mgr.is_processed(place_id):
-                    continue
-                
+            for place_id, facility_name in pending.itertuples(index=False, name=None):
                 processed_count += 1
                 current_total = already_processed + processed_count
                 
@@ -858,66 +936,74 @@ class ReviewScrapingOrchestrator:
             
         finally:
             scraper.close_driver()
-            self.checkpoint_mgr.save_progress()
+            self.checkpoint_mgr.compact()
         
         return self.checkpoint_mgr.progress_data
     
-    def create_review_dataset(self, facilities_df: pd.DataFrame) -> pd.DataFrame:
-        """Create flat dataset with review data"""
+    @staticmethod
+    def _review_record(place_id: str, facility_name: str, review: Dict) -> Tuple:
+        """One REVIEW_COLUMNS row; missing nested dicts are skipped, not allocated"""
+        reviewer_info = review.get('reviewer_info') or {}
+        visit_info = review.get('visit_info') or {}
+        owner_response = review.get('owner_response')
+        reactions = review.get('reactions') or {}
+        images = review.get('images', [])
+        return (
+            place_id,
+            facility_name,
+            review.get('review_index'),
+            reviewer_info.get('reviewer_name'),
+            review.get('review_text'),
+            visit_info.get('visit_date'),
+            visit_info.get('visit_count'),
+            visit_info.get('verification_method'),
+            json.dumps(review.get('visit_keywords', []), ensure_ascii=False),
+            json.dumps(images, ensure_ascii=False),
+            len(images),
+            owner_response is not None,
+            owner_response.get('response_text') if owner_response else None,
+            reactions.get('reaction_count'),
+            review.get('scraped_at')
+        )
+    
+    def create_review_dataset(self, facilities_df: pd.DataFrame) -> "pa.Table":
+        """Create flat dataset with review data, as an Arrow table (no pandas round trip)"""
+        import pyarrow as pa
+        
+        # place_id -> name once (first occurrence), not a column scan per facility
+        ids = facilities_df['place_id'].astype(str)
+        names = pd.Series(facilities_df['name'].to_numpy(), index=ids.to_numpy())
+        names = names[~names.index.duplicated(keep='first')].to_dict()
+        
+        # Tuples rather than one dict per review
         records = []
         
         for place_id, review_data in self.checkpoint_mgr.progress_data.items():
-            # Get facility info
-            facility = facilities_df[facilities_df['place_id'].astype(str) == place_id]
-            
-            if len(facility) > 0:
-                facility_name = facility.iloc[0]['name']
-            else:
-                facility_name = "Unknown"
+            facility_name = names.get(place_id, "Unknown")
             
             if review_data.get('has_reviews') and review_data.get('reviews'):
                 # Create a record for each review
                 for review in review_data['reviews']:
-                    record = {
-                        'place_id': place_id,
-                        'facility_name': facility_name,
-                        'review_index': review.get('review_index'),
-                        'reviewer_name': review.get('reviewer_info', {}).get('reviewer_name'),
-                        'review_text': review.get('review_text'),
-                        'visit_date': review.get('visit_info', {}).get('visit_date'),
-                        'visit_count': review.get('visit_info', {}).get('visit_count'),
-                        'verification_method': review.get('visit_info', {}).get('verification_method'),
-                        'visit_keywords': json.dumps(review.get('visit_keywords', []), ensure_ascii=False),
-                        'image_urls': json.dumps(review.get('images', []), ensure_ascii=False),
-                        'image_count': len(review.get('images', [])),
-                        'has_owner_response': review.get('owner_response') is not None,
-                        'owner_response_text': review.get('owner_response', {}).get('response_text') if review.get('owner_response') else None,
-                        'reaction_count': review.get('reactions', {}).get('reaction_count'),
-                        'scraped_at': review.get('scraped_at')
-                    }
-                    records.append(record)
+                    records.append(self._review_record(place_id, facility_name, review))
             else:
                 # Create a single record for facilities with no reviews
-                record = {
-                    'place_id': place_id,
-                    'facility_name': facility_name,
-                    'review_index': None,
-                    'reviewer_name': None,
-                    'review_text': None,
-                    'visit_date': None,
-                    'visit_count': None,
-                    'verification_method': None,
-                    'visit_keywords': None,
-                    'image_urls': None,
-                    'image_count': 0,
-                    'has_owner_response': False,
-                    'owner_response_text': None,
-                    'reaction_count': None,
-                    'scraped_at': review_data.get('scraped_at')
-                }
-                records.append(record)
+                records.append((place_id, facility_name, None, None, None, None, None, None,
+                                None, None, 0, False, None, None,
+                                review_data.get('scraped_at')))
         
-        return pd.DataFrame(records)
+        # Explicit types: inference would go by whatever the first rows hold
+        int_columns = {'review_index', 'image_count'}
+        schema = pa.schema([
+            (name, pa.int64() if name in int_columns
+             else pa.bool_() if name == 'has_owner_response' else pa.string())
+            for name in self.REVIEW_COLUMNS
+        ])
+        columns = list(zip(*records)) if records else [()] * len(schema)
+        return pa.Table.from_arrays(
+            [pa.array(column, type=field.type, from_pandas=True)
+             for column, field in zip(columns, schema)],
+            schema=schema
+        )
     
     def print_summary(self):
         """Print summary statistics"""
@@ -941,12 +1027,33 @@ class ReviewScrapingOrchestrator:
 # DATASET LOADING
 # ============================================================================
 
-def load_facilities_dataset(source: str = "local") -> pd.DataFrame:
+def filter_facility_names(facilities_df: pd.DataFrame,
+                          name_keywords: Optional[List[str]]) -> pd.DataFrame:
+    """Keep rows whose name contains any of name_keywords; None keeps everything"""
+    if name_keywords is None:
+        return facilities_df
+    # Plain substring searches OR'd together, no regex engine per cell
+    names = facilities_df['name']
+    mask = pd.Series(False, index=facilities_df.index)
+    for keyword in name_keywords:
+        mask |= names.str.contains(keyword, regex=False, na=False)
+    return facilities_df[mask]
+
+
+def load_facilities_dataset(source: str = "local",
+                            columns: Optional[List[str]] = None,
+                            name_keywords: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Load facilities dataset from local file or HuggingFace
     
     Args:
         source: "local" or "huggingface"
+        columns: Only load these columns (None = all). Parquet is then read
+            memory-mapped with column projection, so unread columns are never
+            decoded; mapped pages count towards RSS but are not pinned
+        name_keywords: Only keep facilities whose name contains one of these
+            substrings. For parquet the filter runs in Arrow, before any
+            pandas conversion
     """
     
     if source == "local":
@@ -962,7 +1069,8 @@ def load_facilities_dataset(source: str = "local") -> pd.DataFrame:
         # Try CSV first (most compatible, no PyArrow needed)
         if facilities_file_csv.exists():
             try:
-                facilities_df = pd.read_csv(facilities_file_csv)
+                facilities_df = pd.read_csv(facilities_file_csv, usecols=columns)
+                facilities_df = filter_facility_names(facilities_df, name_keywords)
                 print(f"✓ Loaded {len(facilities_df):,} facilities from CSV")
                 return facilities_df
             except Exception as e:
@@ -971,7 +1079,18 @@ def load_facilities_dataset(source: str = "local") -> pd.DataFrame:
         # Try parquet
         if facilities_file_parquet.exists():
             try:
-                facilities_df = pd.read_parquet(facilities_file_parquet)
+                import pyarrow.parquet as pq
+                import pyarrow.compute as pc
+                
+                table = pq.read_table(facilities_file_parquet, columns=columns,
+                                      memory_map=True)
+                if name_keywords is not None:
+                    # Null names give a null mask entry, which filter drops
+                    mask = pc.match_substring(table['name'], name_keywords[0])
+                    for keyword in name_keywords[1:]:
+                        mask = pc.or_(mask, pc.match_substring(table['name'], keyword))
+                    table = table.filter(mask)
+                facilities_df = table.to_pandas()
                 print(f"✓ Loaded {len(facilities_df):,} facilities from parquet")
                 return facilities_df
             except Exception as e:
@@ -981,6 +1100,9 @@ def load_facilities_dataset(source: str = "local") -> pd.DataFrame:
         if facilities_file_pickle.exists():
             try:
                 facilities_df = pd.read_pickle(facilities_file_pickle)
+                if columns is not None:
+                    facilities_df = facilities_df[columns]
+                facilities_df = filter_facility_names(facilities_df, name_keywords)
                 print(f"✓ Loaded {len(facilities_df):,} facilities from pickle")
                 return facilities_df
             except Exception as e:
@@ -989,7 +1111,8 @@ def load_facilities_dataset(source: str = "local") -> pd.DataFrame:
         # No local file found
         print(f"⚠ No local cache found")
         print(f"  Switching to HuggingFace download...")
-        return load_facilities_dataset(source="huggingface")
+        return load_facilities_dataset(source="huggingface", columns=columns,
+                                       name_keywords=name_keywords)
     
     elif source == "huggingface":
         print("="*70)
@@ -1039,7 +1162,10 @@ def load_facilities_dataset(source: str = "local") -> pd.DataFrame:
         except Exception as e:
             print(f"⚠ Could not save cache: {e}")
         
-        return facilities_df
+        if columns is not None:
+            facilities_df = facilities_df[columns]
+        
+        return filter_facility_names(facilities_df, name_keywords)
     
     else:
         raise ValueError(f"Invalid source: {source}. Use 'local' or 'huggingface'")
@@ -1062,25 +1188,15 @@ def main(partition_x: int = 1, partition_y: int = 1):
     print("STEP 1: LOADING FACILITIES DATASET")
     print("="*70)
     
-    # Try local first, fallback to HuggingFace
-    facilities_df = load_facilities_dataset(source="local")
-    
-    # Clean and validate
-    facilities_df = facilities_df[
-        facilities_df['place_id'].notna() & 
-        facilities_df['name'].notna()
-    ].copy()
+    # Try local first, fallback to HuggingFace. Scraping only needs id and name
+    # of hospitals/clinics, so the name filter is applied while loading
+    medical_facilities = load_facilities_dataset(source="local", columns=['place_id', 'name'],
+                                                 name_keywords=['병원', '의원'])
     
-    print(f"✓ {len(facilities_df):,} facilities with valid place_id and name")
+    # Clean and validate (name is already non-null after the filter)
+    medical_facilities = medical_facilities[medical_facilities['place_id'].notna()]
     
-    # Filter for hospitals/clinics if needed
-    if 'name' in facilities_df.columns:
-        medical_facilities = facilities_df[
-            facilities_df['name'].str.contains('병원|의원', na=False)
-        ]
-        print(f"✓ Filtered to {len(medical_facilities):,} medical facilities")
-    else:
-        medical_facilities = facilities_df
+    print(f"✓ Filtered to {len(medical_facilities):,} medical facilities with valid place_id")
     
     print("\n" + "="*70)
     print("STEP 2: SCRAPING REVIEWS")
@@ -1113,19 +1229,24 @@ def main(partition_x: int = 1, partition_y: int = 1):
     print("STEP 4: CREATING REVIEW DATASET")
     print("="*70)
     
-    review_df = orchestrator.create_review_dataset(medical_facilities)
+    review_table = orchestrator.create_review_dataset(medical_facilities)
+    
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
     
     # Add partition suffix to output files
     partition_suffix = orchestrator.partition_suffix
     
     output_file = Path(f"./data/seoul_medical_reviews{partition_suffix}.parquet")
-    review_df.to_parquet(output_file, index=False)
+    pq.write_table(review_table, str(output_file))
     print(f"✓ Saved review dataset: {output_file}")
-    print(f"  Total review records: {len(review_df):,}")
+    print(f"  Total review records: {review_table.num_rows:,}")
     
     # Also save as CSV for easy viewing
     csv_file = Path(f"./data/seoul_medical_reviews{partition_suffix}.csv")
-    review_df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+    with open(csv_file, 'wb') as f:
+        f.write(b'\xef\xbb\xbf')  # UTF-8 BOM so Excel reads Korean text
+        pa_csv.write_csv(review_table, f)
     print(f"✓ Saved CSV version: {csv_file}")
     
     if partition_y > 1:
@@ -1139,7 +1260,7 @@ def main(partition_x: int = 1, partition_y: int = 1):
         print(f"   PARTITION {partition_x}/{partition_y}")
     print("="*70)
     
-    return review_df
+    return review_table
 
 
 if __name__ == "__main__":
@@ -1163,7 +1284,7 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
-    review_df = main(
+    review_table = main(
         partition_x=args.partition_x,
         partition_y=args.partition_y
     )
\ No newline at end of file